@@ -3,6 +3,11 @@
 #----------------------------------------------------------
 from pathlib import Path
 import logging
+import sys
+
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.loader import open_input
 
 
 def part_1(input_lines) -> int:
@@ -20,10 +25,8 @@ if __name__ == "__main__":
     #aoc_input = Path(__file__).with_name('input.txt')
     aoc_input = Path(__file__).with_name('input_test.txt') 
     print(f'reading from: {aoc_input}')
-    with aoc_input.open('r') as f:
-       #lines = " ".join(line.rstrip() for line in file)
-       lines = f.readlines()
-    lines = [x.strip() for x in lines]
+    # memory-mapped and decoded a line at a time, instead of f.readlines()
+    lines = open_input(aoc_input).stripped()
     answer_1 = part_1(lines)
     print(f'part 1 answer: {answer_1}')
 
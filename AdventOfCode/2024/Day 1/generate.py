@@ -0,0 +1,11 @@
+#----------------------------------------------------------
+# AoC 2024 Day 1 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = number of location pairs, the locations are 5 digits like the real
+    # input but drawn from a narrower range for small sizes, so that they repeat
+    highest = min(99999, 10000 + 2 * size)
+    for _ in range(size):
+        yield f'{rng.randint(10000, highest)}   {rng.randint(10000, highest)}'
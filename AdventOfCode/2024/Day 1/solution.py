@@ -2,37 +2,114 @@
 # AoC 2024 Day 1
 #----------------------------------------------------------
 from pathlib import Path
+from array import array
+from collections import Counter
+import heapq
+import sys
 
-def part_1(input_lines) -> int:
-    location_a = []
-    location_b = []
-    for line in input_lines:
-        a, b = map(int, line.split(maxsplit=1))
-        location_a.append(a)
-        location_b.append(b)
-    location_a = sorted(location_a)
-    location_b = sorted(location_b)
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import optional_import
+
+# numpy is optional, without it the lists are kept as compact arrays of ints
+np = optional_import('numpy')
+
+# about a million lines, so only inputs bigger than that sort in runs and merge
+CHUNK_SIZE = 1 << 24
+
+def lineChunks(input_lines, chunk_size=CHUNK_SIZE):
+    # the input a chunk of whole lines at a time, so both numbers of a
+    # line are always in the same chunk and no number is cut in two
+    data = getattr(input_lines, 'data', None)
+    if data is None:
+        # plain str lines (running this file directly)
+        yield '\n'.join(input_lines).encode()
+        return
+    carry = b''
+    for start in range(0, len(data), chunk_size):
+        chunk = carry + bytes(data[start:start + chunk_size])
+        cut = chunk.rfind(b'\n') + 1
+        yield chunk[:cut]
+        carry = chunk[cut:]
+    yield carry
+
+def sortedRuns(runs) -> array:
+    # merges sorted arrays into one without a list of every number in between
+    if len(runs) == 1:
+        return runs[0]
+    return array('q', heapq.merge(*runs))
+
+def parse(input_lines):
+    # both columns a chunk at a time, then sorted once for both parts
+    if np is not None:
+        locations = np.concatenate([np.fromstring(chunk, dtype=np.int64, sep=' ')
+                                    for chunk in lineChunks(input_lines)]).reshape(-1, 2)
+        return np.sort(locations[:, 0]), np.sort(locations[:, 1])
+    # each chunk's numbers are only Python objects while it's sorted
+    runs_a, runs_b = [], []
+    for chunk in lineChunks(input_lines):
+        locations = array('q', map(int, chunk.split()))
+        if locations:
+            runs_a.append(array('q', sorted(locations[0::2])))
+            runs_b.append(array('q', sorted(locations[1::2])))
+    return sortedRuns(runs_a), sortedRuns(runs_b)
+
+def part_1(location_a, location_b) -> int:
+    # test answer = 11, answer = 2176849
+    if np is not None:
+        return int(np.abs(location_a - location_b).sum())
     total_distance = 0
     for a, b in zip(location_a, location_b):
         total_distance += abs(a - b)
     return total_distance
 
-def part_2(input_lines) -> int:
-    location_a = []
-    location_b = {}
-    for line in input_lines:
-        a, b = map(int, line.split(maxsplit=1))
-        location_a.append(a)
-        if b in location_b:
-            location_b[b] += 1
-        else:
-            location_b[b] = 1
+def part_2(location_a, location_b) -> int:
+    # test answer = 31, answer = 23384288
+    if np is not None:
+        # look up how often each left location is in the right list
+        locations, counts = np.unique(location_b, return_counts=True)
+        found_at = np.searchsorted(locations, location_a)
+        found_at[found_at == len(locations)] = 0
+        in_both = locations[found_at] == location_a
+        return int((location_a[in_both] * counts[found_at[in_both]]).sum())
+    counts_b = Counter(location_b)
     similarity_score = 0
     for location in location_a:
-        if location in location_b:
-            similarity_score += location * location_b[location]
+        similarity_score += location * counts_b[location]
     return similarity_score
 
+def totalDistance(counts_a, counts_b) -> int:
+    # pairing the smallest with the smallest and so on is the same walk
+    # as zipping the two sorted lists, but only needs the distinct locations
+    total_distance = 0
+    iter_a = iter(sorted(counts_a.items()))
+    iter_b = iter(sorted(counts_b.items()))
+    a, left_a = next(iter_a, (0, 0))
+    b, left_b = next(iter_b, (0, 0))
+    while left_a and left_b:
+        paired = min(left_a, left_b)
+        total_distance += paired * abs(a - b)
+        left_a -= paired
+        left_b -= paired
+        if not left_a:
+            a, left_a = next(iter_a, (0, 0))
+        if not left_b:
+            b, left_b = next(iter_b, (0, 0))
+    return total_distance
+
+def stream(input_lines) -> tuple:
+    # one pass for both parts, keeping a count of each location
+    # rather than the full lists
+    counts_a = Counter()
+    counts_b = Counter()
+    for line in input_lines:
+        if line.strip():
+            a, b = map(int, line.split(maxsplit=1))
+            counts_a[a] += 1
+            counts_b[b] += 1
+    similarity_score = sum(location * n * counts_b[location] for location, n in counts_a.items())
+    return totalDistance(counts_a, counts_b), similarity_score
+
 if __name__ == "__main__":
     aoc_input = Path(__file__).with_name('input.txt')
     #aoc_input = Path(__file__).with_name('input_test.txt')
@@ -40,10 +117,10 @@ if __name__ == "__main__":
     with aoc_input.open('r') as f:
        #lines = " ".join(line.rstrip() for line in file)
        lines = f.readlines()
-    lines = [x.strip() for x in lines]
-    answer_1 = part_1(lines)
+    location_a, location_b = parse(lines)
+    answer_1 = part_1(location_a, location_b)
     print(f'part 1 answer: {answer_1}')
 
-    answer_2 = part_2(lines)
+    answer_2 = part_2(location_a, location_b)
     print(f'part 2 answer: {answer_2}')
     
\ No newline at end of file
@@ -0,0 +1,15 @@
+#----------------------------------------------------------
+# AoC 2024 Day 10 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = the side of the square map, the heights rise diagonally so there are plenty of trails
+    for r in range(size):
+        row = []
+        for c in range(size):
+            if rng.random() < 0.1:
+                row.append(str(rng.randint(0, 9)))
+            else:
+                row.append(str((r + c) % 10))
+        yield ''.join(row)
@@ -3,41 +3,35 @@
 #----------------------------------------------------------
 from pathlib import Path
 import logging
+import sys
 from copy import copy
 
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid
+
+IMPASSABLE = ord('.')
+# the order the branches are checked in: NORTH, SOUTH, EAST, WEST
+BRANCH_DIRECTIONS = ((-1, 0), (1, 0), (0, 1), (0, -1))
+
 
 def checkPossibleBranches(map, position) -> list:
     step_number, r, c = position
     step_number += 1
     branch_check = []
-    # check NORTH of the given position
-    if (r - 1) >= 0:
-        if map[r-1][c] != '.' and map[r][c] != '.':
-            if (map[r-1][c] - map[r][c]) == 1:
-                # log a branch point
-                branch_check.append((step_number, r-1, c))
-    # check SOUTH of the given position
-    if (r + 1) < len(map):
-        if map[r+1][c] != '.' and map[r][c] != '.':
-            if (map[r+1][c] - map[r][c]) == 1:
-                # log a branch point
-                branch_check.append((step_number, r+1, c))
-    # check EAST of the given position
-    if (c + 1) < len(map[0]):
-        if map[r][c+1] != '.' and map[r][c] != '.':
-            if (map[r][c+1] - map[r][c]) == 1:
-                # log a branch point
-                branch_check.append((step_number, r, c+1))
-    # check WEST of the given position
-    if (c - 1) >= 0:
-        if map[r][c-1] != '.' and map[r][c] != '.':
-            if (map[r][c-1] - map[r][c]) == 1:
-                # log a branch point
-                branch_check.append((step_number, r, c-1))
+    here = map[r, c]
+    if here == IMPASSABLE:
+        return branch_check
+    for dr, dc in BRANCH_DIRECTIONS:
+        # off the map comes back as IMPASSABLE too
+        there = map.get(r + dr, c + dc, IMPASSABLE)
+        if there != IMPASSABLE and (there - here) == 1:
+            # log a branch point
+            branch_check.append((step_number, r + dr, c + dc))
     return branch_check
 
 def followPathToPeakOnce(input_path, step_number, map, these_paths):
-    MAX_ALT = 9
+    MAX_ALT = ord('9')
     this_path = copy(input_path)
     branch_points = checkPossibleBranches(map, this_path[-1])
     for step in branch_points:
@@ -46,7 +40,7 @@ def followPathToPeakOnce(input_path, step_number, map, these_paths):
             this_path.pop()
         this_path.append(step)
         step_number, r, c = step
-        if map[r][c] == MAX_ALT:
+        if map[r, c] == MAX_ALT:
             # the altitude is MAX and it's not a peak we've already reached, we're done
             new_peak = True
             for one_path in these_paths:
@@ -64,20 +58,8 @@ def followPathToPeakOnce(input_path, step_number, map, these_paths):
 
 def part_1(input_lines) -> int:
     # test answer = 36, answer = 688
-    map = []
-    trailheads = []
-    for r, line in enumerate(input_lines):
-        #map_row = [int(e) for e in list(line)]
-        map_row = []
-        for e in list(line):
-            if e == '.':
-                map_row.append(e)
-            else:
-                map_row.append(int(e))
-        map.append(map_row)
-        for c, elevation in enumerate(map_row):
-            if elevation == 0:
-                trailheads.append((r,c))
+    map = Grid.from_lines(input_lines)
+    trailheads = [map.coords(i) for i in map.find_all('0')]
 
     branch_points = []
     all_paths = []
@@ -94,7 +76,7 @@ def part_1(input_lines) -> int:
 
 
 def followPathToPeakScore(input_path, step_number, map, these_peaks):
-    MAX_ALT = 9
+    MAX_ALT = ord('9')
     this_path = copy(input_path)
     branch_points = checkPossibleBranches(map, this_path[-1])
     for step in branch_points:
@@ -103,7 +85,7 @@ def followPathToPeakScore(input_path, step_number, map, these_peaks):
             this_path.pop()
         this_path.append(step)
         step_number, r, c = step
-        if map[r][c] == MAX_ALT:
+        if map[r, c] == MAX_ALT:
             # the altitude is MAX and it's not a peak we've already reached, we're done
             if (r,c) in these_peaks.keys():
                 these_peaks[(r,c)] += 1
@@ -114,20 +96,8 @@ def followPathToPeakScore(input_path, step_number, map, these_peaks):
 
 def part_2(input_lines) -> int:
     # test answer = 81, answer = xxxx
-    map = []
-    trailheads = []
-    for r, line in enumerate(input_lines):
-        #map_row = [int(e) for e in list(line)]
-        map_row = []
-        for e in list(line):
-            if e == '.':
-                map_row.append(e)
-            else:
-                map_row.append(int(e))
-        map.append(map_row)
-        for c, elevation in enumerate(map_row):
-            if elevation == 0:
-                trailheads.append((r,c))
+    map = Grid.from_lines(input_lines)
+    trailheads = [map.coords(i) for i in map.find_all('0')]
 
     branch_points = []
     all_paths = []
@@ -0,0 +1,8 @@
+#----------------------------------------------------------
+# AoC 2024 Day 11 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = number of stones
+    yield ' '.join(str(rng.choice((0, 1, rng.randint(2, 9999999)))) for _ in range(size))
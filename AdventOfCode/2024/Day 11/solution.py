@@ -102,7 +102,7 @@ class StoneDict:
         return result
 
 
-def part_1(input_lines, max_blinks) -> int:
+def part_1(input_lines, max_blinks=25) -> int:
     # test answer = 55312, answer (25) = 228668, answer (75) = 
     stones = input_lines[0].split(' ')
     start_time = time.perf_counter()
@@ -117,7 +117,7 @@ def part_1(input_lines, max_blinks) -> int:
     print(f'Part 1 elapsed time for {max_blinks} blinks = {(finish_time - start_time):04f} secs')
     return len(stones)
 
-def part_2(input_lines, max_blinks) -> int:
+def part_2(input_lines, max_blinks=75) -> int:
     # test answer = 55312, answer (25) = 228668, answer (75) = 270673834779359
     # dictionary value is:  (stone result list, count for this stone)
     stones = StoneDict();
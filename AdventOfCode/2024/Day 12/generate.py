@@ -0,0 +1,18 @@
+#----------------------------------------------------------
+# AoC 2024 Day 12 - large input generator
+#----------------------------------------------------------
+import string
+
+BLOCK_SIZE = 8
+NOISE = 0.05
+
+
+def generate(size, rng):
+    # size = the side of the square garden, plots come in blocks with a few strays
+    block_rows = []
+    for _ in range(size // BLOCK_SIZE + 1):
+        block_rows.append([rng.choice(string.ascii_uppercase) for _ in range(size // BLOCK_SIZE + 1)])
+    for r in range(size):
+        blocks = block_rows[r // BLOCK_SIZE]
+        yield ''.join(rng.choice(string.ascii_uppercase) if rng.random() < NOISE else blocks[c // BLOCK_SIZE]
+                      for c in range(size))
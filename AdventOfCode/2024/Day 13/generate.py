@@ -0,0 +1,22 @@
+#----------------------------------------------------------
+# AoC 2024 Day 13 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = number of claw machines, about half have a prize that can be won
+    for i in range(size):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        while ax * by == ay * bx:
+            # buttons moving the same way have no single answer, draw B again
+            bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        prize_x = a * ax + b * bx
+        prize_y = a * ay + b * by
+        if rng.random() < 0.5:
+            prize_x += 1
+        if i:
+            yield ''
+        yield f'Button A: X+{ax}, Y+{ay}'
+        yield f'Button B: X+{bx}, Y+{by}'
+        yield f'Prize: X={prize_x}, Y={prize_y}'
@@ -10,15 +10,11 @@ class ClawMachine:
     # generates an ID for each separate machine
     machine_id_gen = itertools.count()
 
-    def __init__(self, input_lines, prize_offset=0):
+    def __init__(self, button_a, button_b, prize, prize_offset=0):
         self._id = next(ClawMachine.machine_id_gen)
-        parse_buttons = R"X\+(\d+), Y\+(\d+)"
-        parse_prize = R"X\=(\d+), Y\=(\d+)"
-        re_buttons = re.compile(parse_buttons)
-        re_prize = re.compile(parse_prize)
-        self._buttonA_x, self._buttonA_y = map(int, re_buttons.search(input_lines[0]).groups())
-        self._buttonB_x, self._buttonB_y = map(int, re_buttons.search(input_lines[1]).groups())
-        self._prize_x, self._prize_y = map(int, re_prize.search(input_lines[2]).groups())
+        self._buttonA_x, self._buttonA_y = button_a
+        self._buttonB_x, self._buttonB_y = button_b
+        self._prize_x, self._prize_y = prize
         self._prize_x += prize_offset
         self._prize_y += prize_offset
         logging.debug(f'Machine {self._id}')
@@ -59,22 +55,37 @@ class ClawMachine:
         return int((self._buttonA_presses * 3) + self._buttonB_presses)
         
 
-def part_1(input_lines) -> int:
+def parse(input_lines) -> list:
+    # each machine is 3 lines (button A, button B, prize) and a blank line,
+    # returned as the ((ax, ay), (bx, by), (prize x, prize y)) numbers
+    parse_buttons = R"X\+(\d+), Y\+(\d+)"
+    parse_prize = R"X\=(\d+), Y\=(\d+)"
+    re_buttons = re.compile(parse_buttons)
+    re_prize = re.compile(parse_prize)
+    machine_specs = []
+    for i in range(0, len(input_lines), 4):
+        button_a = tuple(map(int, re_buttons.search(input_lines[i]).groups()))
+        button_b = tuple(map(int, re_buttons.search(input_lines[i+1]).groups()))
+        prize = tuple(map(int, re_prize.search(input_lines[i+2]).groups()))
+        machine_specs.append((button_a, button_b, prize))
+    return machine_specs
+
+def part_1(machine_specs) -> int:
     # test answer = 480, answer = 36571
     machines = []
-    for i in range(0, len(input_lines), 4):
-        machines.append(ClawMachine(input_lines[i:i+4]))
+    for button_a, button_b, prize in machine_specs:
+        machines.append(ClawMachine(button_a, button_b, prize))
     logging.debug(f'there are {len(machines)} machines')
     total_tokens = 0
     for m in machines:
         total_tokens += m.tokenCost()
     return total_tokens
 
-def part_2(input_lines) -> int:
+def part_2(machine_specs) -> int:
     # test answer = 875318608908, answer = 85527711500010
     machines = []
-    for i in range(0, len(input_lines), 4):
-        machines.append(ClawMachine(input_lines[i:i+4], prize_offset=10000000000000))
+    for button_a, button_b, prize in machine_specs:
+        machines.append(ClawMachine(button_a, button_b, prize, prize_offset=10000000000000))
     logging.debug(f'there are {len(machines)} machines')
     total_tokens = 0
     for m in machines:
@@ -91,10 +102,10 @@ if __name__ == "__main__":
     with aoc_input.open('r') as f:
        #lines = " ".join(line.rstrip() for line in file)
        lines = f.readlines()
-    lines = [x.strip() for x in lines]
-    answer_1 = part_1(lines)
+    machine_specs = parse(lines)
+    answer_1 = part_1(machine_specs)
     print(f'part 1 answer: {answer_1}')
 
-    answer_2 = part_2(lines)
+    answer_2 = part_2(machine_specs)
     print(f'part 2 answer: {answer_2}')
     
\ No newline at end of file
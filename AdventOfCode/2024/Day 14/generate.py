@@ -0,0 +1,15 @@
+#----------------------------------------------------------
+# AoC 2024 Day 14 - large input generator
+#----------------------------------------------------------
+
+
+MAP_WIDTH = 101
+MAP_HEIGHT = 103
+
+
+def generate(size, rng):
+    # size = number of robots
+    for _ in range(size):
+        x, y = rng.randrange(MAP_WIDTH), rng.randrange(MAP_HEIGHT)
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        yield f'p={x},{y} v={vx},{vy}'
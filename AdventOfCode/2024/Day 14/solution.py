@@ -151,26 +151,30 @@ class MapSpace:
 
         
 
-def part_1(input_lines) -> int:
-    # test answer = 12, answer = 236628054
-    mapspace = MapSpace(mapH=103, mapW=101)
+def parse(input_lines) -> list:
+    # the (x0, y0, vx, vy) of each robot
     parse_robot = R"p\=(-?\d+),(-?\d+) v\=(-?\d+),(-?\d+)"
     re_robot = re.compile(parse_robot)
+    robot_specs = []
     for line in input_lines:
-        x0, y0, vx, vy = map(int, re_robot.search(line).groups())
+        if line.strip():
+            robot_specs.append(tuple(map(int, re_robot.search(line).groups())))
+    return robot_specs
+
+def part_1(robot_specs) -> int:
+    # test answer = 12, answer = 236628054
+    mapspace = MapSpace(mapH=103, mapW=101)
+    for x0, y0, vx, vy in robot_specs:
         mapspace.addRobot(Robot(x0, y0, vx, vy, mapH=103, mapW=101))
     mapspace.takeStep(100)
     quad_totals = mapspace.quadrantCounts()
     safety_factor = math.prod(quad_totals)
     return safety_factor
 
-def part_2(input_lines) -> int:
+def part_2(robot_specs) -> int:
     # test answer = yyy, answer = xxxx
     mapspace = MapSpace(mapH=103, mapW=101)
-    parse_robot = R"p\=(-?\d+),(-?\d+) v\=(-?\d+),(-?\d+)"
-    re_robot = re.compile(parse_robot)
-    for line in input_lines:
-        x0, y0, vx, vy = map(int, re_robot.search(line).groups())
+    for x0, y0, vx, vy in robot_specs:
         mapspace.addRobot(Robot(x0, y0, vx, vy, mapH=103, mapW=101))
     while mapspace.easterEggNotFound():
         mapspace.takeStep()
@@ -186,10 +190,10 @@ if __name__ == "__main__":
     with aoc_input.open('r') as f:
        #lines = " ".join(line.rstrip() for line in file)
        lines = f.readlines()
-    lines = [x.strip() for x in lines]
-    answer_1 = part_1(lines)
+    robot_specs = parse(lines)
+    answer_1 = part_1(robot_specs)
     print(f'part 1 answer: {answer_1}')
 
-    answer_2 = part_2(lines)
+    answer_2 = part_2(robot_specs)
     print(f'part 2 answer: {answer_2}')
     
\ No newline at end of file
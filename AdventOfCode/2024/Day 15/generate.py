@@ -0,0 +1,28 @@
+#----------------------------------------------------------
+# AoC 2024 Day 15 - large input generator
+#----------------------------------------------------------
+
+
+MOVES_PER_LINE = 1000
+
+
+def generate(size, rng):
+    # size = the side of the square warehouse, with 10 moves per cell of the side
+    robot = size // 2
+    for r in range(size):
+        if r in (0, size - 1):
+            yield '#' * size
+            continue
+        row = ['#']
+        for c in range(1, size - 1):
+            if (r, c) == (robot, robot):
+                row.append('@')
+            else:
+                roll = rng.random()
+                row.append('#' if roll < 0.05 else 'O' if roll < 0.25 else '.')
+        row.append('#')
+        yield ''.join(row)
+    yield ''
+    moves = size * 10
+    for start in range(0, moves, MOVES_PER_LINE):
+        yield ''.join(rng.choices('<>^v', k=min(MOVES_PER_LINE, moves - start)))
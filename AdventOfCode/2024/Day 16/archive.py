@@ -1,7 +1,16 @@
 import logging
 import copy
+import sys
+from pathlib import Path
 from queue import Queue
-import networkx as nx
+
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import lazy_import
+
+# only the graph and BFS experiments use these, so they're loaded on first use
+np = lazy_import('numpy')
+nx = lazy_import('networkx')
 
 def visualizePath(maze, path) -> str:
     grid_map = f'\npath:\n'
@@ -93,7 +102,7 @@ def findPathBFS(maze, start, end):
                 visited[next_node] = True
                 queue.put((next_node, path + [next_node]))
 
-def createGraph(maze, start_pt, end_pt) -> nx.Graph:
+def createGraph(maze, start_pt, end_pt) -> 'nx.Graph':
     rows, cols = len(maze), len(maze[0])
     wg = nx.grid_2d_graph(rows, cols)
     for r, row in enumerate(maze):
@@ -0,0 +1,28 @@
+#----------------------------------------------------------
+# AoC 2024 Day 16 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = the side of the square maze (made odd), carved as a random depth first
+    # maze, with S in the bottom left and E in the top right corners
+    size = max(5, size | 1)
+    maze = [['#'] * size for _ in range(size)]
+    start = (size - 2, 1)
+    maze[start[0]][start[1]] = '.'
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        steps = [(dr, dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                 if 0 < r + dr < size - 1 and 0 < c + dc < size - 1 and maze[r + dr][c + dc] == '#']
+        if not steps:
+            stack.pop()
+            continue
+        dr, dc = rng.choice(steps)
+        maze[r + dr // 2][c + dc // 2] = '.'
+        maze[r + dr][c + dc] = '.'
+        stack.append((r + dr, c + dc))
+    maze[start[0]][start[1]] = 'S'
+    maze[1][size - 2] = 'E'
+    for row in maze:
+        yield ''.join(row)
@@ -26,6 +26,11 @@ def create_maze(input_lines):
         maze.append(maze_row)
     return start_here, end_here, maze
 
+def parse(input_lines):
+    """ Builds the maze and returns the arguments both parts expect. """
+    start_pt, end_pt, maze = create_maze([x.strip() for x in input_lines])
+    return maze, start_pt, end_pt
+
 def part_1(maze, start_pt, end_pt) -> int:
     """ test answer = yyy, answer = xxxx """
     solver = MazeSolver(maze, start_pt, end_pt)
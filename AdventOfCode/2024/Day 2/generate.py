@@ -0,0 +1,19 @@
+#----------------------------------------------------------
+# AoC 2024 Day 2 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = number of reports, most are safe or one bad level away from it
+    for _ in range(size):
+        level = rng.randint(1, 99)
+        direction = rng.choice((-1, 1))
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3) * direction
+            if rng.random() < 0.1:
+                # an unsafe step
+                step = rng.choice((0, 5 * direction, -step))
+            level += step
+            levels.append(level)
+        yield ' '.join(map(str, levels))
@@ -2,22 +2,31 @@
 # AoC 2024 Day 2
 #----------------------------------------------------------
 from pathlib import Path
+import sys
+
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.lazy import optional_import
+
+# numpy is optional, without it the reports are checked one at a time
+np = optional_import('numpy')
 
 MIN_DISTANCE = 1
 MAX_DISTANCE = 3
+DIRECTIONS = (1, -1)
 
 
 def levelsAreSequential(levels):
     ascending = True
-    if levels[0] < levels[1]:
+    if levels[0] > levels[1]:
         ascending = False
     for i in range(0, len(levels) - 1):
         if ascending:
-            if levels[i] < levels[i+1]:
+            if levels[i] > levels[i+1]:
                 # oops, these two aren't ascending
                 return False
         else:
-            if levels[i] > levels[i+1]:
+            if levels[i] < levels[i+1]:
                 # oops, these two aren't descending
                 return False
     return True
@@ -34,32 +43,107 @@ def levelsAreSafe(levels):
         return True
     return False
 
-def part_1(input_lines) -> int:
-    # answer = 510
+def firstUnsafeStep(levels, direction, skip=-1) -> int:
+    # the index of the level where the first unsafe step (going up for
+    # direction 1, down for -1) starts, or -1 when every step is safe,
+    # the level at skip is left out
+    previous = -1
+    for i, level in enumerate(levels):
+        if i == skip:
+            continue
+        if previous >= 0:
+            step = (level - levels[previous]) * direction
+            if step < MIN_DISTANCE or step > MAX_DISTANCE:
+                return previous
+        previous = i
+    return -1
+
+def dampenedLevelsAreSafe(levels):
+    # the first unsafe step, levels[i] to levels[i+1], is still there
+    # unless one of those two is removed, so they're the only two removals
+    # worth trying, three O(n) scans per direction rather than one per level
+    for direction in DIRECTIONS:
+        i = firstUnsafeStep(levels, direction)
+        if i < 0:
+            return True
+        if firstUnsafeStep(levels, direction, skip=i) < 0 or firstUnsafeStep(levels, direction, skip=i+1) < 0:
+            return True
+    return False
+
+def safeSteps(steps, direction):
+    in_range = steps * direction
+    return (in_range >= MIN_DISTANCE) & (in_range <= MAX_DISTANCE)
+
+def batchReportSafety(reports) -> tuple:
+    # all the reports as one matrix, padded on the right to the longest
+    # report plus two, so both dampened checks for every report are a few
+    # whole-matrix operations on the difference matrix
+    lengths = np.array([len(levels) for levels in reports])
+    rows = np.arange(len(reports))
+    width = int(lengths.max()) + 2
+    matrix = np.zeros((len(reports), width), dtype=np.int64)
+    matrix[np.arange(width) < lengths[:, None]] = np.concatenate([np.asarray(levels) for levels in reports])
+    steps = np.diff(matrix, axis=1)
+    # the steps after the end of a report don't count against it
+    padding = np.arange(width - 1) >= (lengths - 1)[:, None]
+
+    safe = np.zeros(len(reports), dtype=bool)
+    dampened_safe = np.zeros(len(reports), dtype=bool)
+    for direction in DIRECTIONS:
+        safe_steps = safeSteps(steps, direction) | padding
+        all_safe = safe_steps.all(axis=1)
+        # safe_after[:, i] is whether every step from levels[i] on is safe
+        safe_after = np.ones((len(reports), width), dtype=bool)
+        safe_after[:, :-1] = np.logical_and.accumulate(safe_steps[:, ::-1], axis=1)[:, ::-1]
+        # the first unsafe step, from levels[i] to levels[i+1], as in dampenedLevelsAreSafe()
+        i = safe_steps.argmin(axis=1)
+        # without levels[i], levels[i-1] is followed by levels[i+1]
+        joined = safeSteps(matrix[rows, i+1] - matrix[rows, i-1], direction) | (i == 0)
+        without_first = joined & safe_after[rows, i+1]
+        # without levels[i+1], levels[i] is followed by levels[i+2]
+        joined = safeSteps(matrix[rows, i+2] - matrix[rows, i], direction) | (i + 2 >= lengths)
+        without_second = joined & safe_after[rows, i+2]
+        safe |= all_safe
+        dampened_safe |= all_safe | without_first | without_second
+    return int(safe.sum()), int(dampened_safe.sum())
+
+def parse(input_lines):
+    return [list(map(int, line.split())) for line in input_lines if line.strip()]
+
+def part_1(reports) -> int:
+    # test answer = 2, answer = 510
+    if np is not None:
+        return batchReportSafety(reports)[0]
     safe_total = 0
-    for line in input_lines:
-        levels = list(map(int, line.split()))
+    for levels in reports:
         if levelsAreSafe(levels):
             safe_total += 1
     return safe_total
 
-def part_2(input_lines) -> int:
-    # answer = 533
+def part_2(reports) -> int:
+    # test answer = 4, answer = 553
+    if np is not None:
+        return batchReportSafety(reports)[1]
+    safe_total = 0
+    for levels in reports:
+        if dampenedLevelsAreSafe(levels):
+            safe_total += 1
+    return safe_total
+
+def stream(input_lines) -> tuple:
+    # both parts in one pass, a report is only ever looked at once
     safe_total = 0
+    dampened_safe_total = 0
     for line in input_lines:
         levels = list(map(int, line.split()))
+        if not levels:
+            continue
         if levelsAreSafe(levels):
             safe_total += 1
-        else:
-            # sequentially remove each level to see if the 
-            # level set becomes safe
-            for i in range(0, len(levels)):
-                reduced_levels = levels.copy()
-                reduced_levels.pop(i)
-                if levelsAreSafe(reduced_levels):
-                    safe_total += 1
-                    break
-    return safe_total
+            dampened_safe_total += 1
+        elif dampenedLevelsAreSafe(levels):
+            dampened_safe_total += 1
+    return safe_total, dampened_safe_total
 
 if __name__ == "__main__":
     aoc_input = Path(__file__).with_name('input.txt')
@@ -69,8 +153,9 @@ if __name__ == "__main__":
        #lines = " ".join(line.rstrip() for line in file)
        lines = f.readlines()
     lines = [x.strip() for x in lines]
-    answer_1 = part_1(lines)
+    reports = parse(lines)
+    answer_1 = part_1(reports)
     print(f'part 1 answer: {answer_1}')
 
-    answer_2 = part_2(lines)
+    answer_2 = part_2(reports)
     print(f'part 2 answer: {answer_2}')
@@ -0,0 +1,29 @@
+#----------------------------------------------------------
+# AoC 2024 Day 3 - large input generator
+#----------------------------------------------------------
+import string
+
+JUNK = string.ascii_letters + string.digits + string.punctuation + ' '
+INSTRUCTIONS_PER_LINE = 200
+
+
+def instruction(rng) -> str:
+    kind = rng.random()
+    if kind < 0.05:
+        return "don't()"
+    if kind < 0.1:
+        return 'do()'
+    if kind < 0.2:
+        # almost an instruction, but corrupted
+        return rng.choice(('mul(4*', 'mul ( 2 , 4 )', 'mul[3,7]', 'mul(6,9!'))
+    return f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+
+
+def generate(size, rng):
+    # size = number of instructions, with corrupted memory in between
+    for start in range(0, size, INSTRUCTIONS_PER_LINE):
+        pieces = []
+        for _ in range(min(INSTRUCTIONS_PER_LINE, size - start)):
+            pieces.append(''.join(rng.choices(JUNK, k=rng.randint(0, 8))))
+            pieces.append(instruction(rng))
+        yield ''.join(pieces)
@@ -4,45 +4,66 @@
 from pathlib import Path
 import re
 
+# finds "mul(xx,yy)" with the operands captured -or- "do()" -or- "don't()",
+# which has "n't" captured. The puzzle only counts 1-3 digit operands, so
+# "mul(1234,5)" isn't an instruction, and that bound is what keeps the
+# tail carried between chunks short
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do(n't)?\(\)")
+# "mul(123,456)", the longest instruction
+LONGEST_INSTRUCTION = 12
+CHUNK_SIZE = 1 << 20
 
-def part_1(input_lines) -> int:
-    total = 0
-    expression1 = R"(mul\(\d+,\d+\))"
-    pattern = re.compile(expression1)
-    expression2 = R"\d+,\d+"
-    numbers = re.compile(expression2)
-    for line in input_lines:
-        ops = pattern.findall(line)
-        #print(ops)
-        for op in ops:
-            a,b = map(int, numbers.findall(op)[0].split(','))
-            total += a * b
-            #print(f"a,b: {a}, {b}")
-    return total
+# stream() scans the raw bytes, the memory dump has no useful lines
+STREAM_CHUNKS = True
 
-def part_2(input_lines) -> int:
-    total = 0
-    # finds "mul(xx,yy)" -or- "do()" -or- "don't"
-    expression1 = R"(mul\(\d+,\d+\))|(do\(\))|(don't\(\))"
-    pattern = re.compile(expression1)
-    expression2 = R"\d+,\d+"
-    numbers = re.compile(expression2)
 
+def scanMemory(chunks) -> tuple:
+    # both totals in one pass over the chunks, an instruction split across
+    # two chunks is found once the tail of one is put in front of the next
+    total = 0
+    enabled_total = 0
     mul_is_enabled = True
-    for line in input_lines:
-        op_iter = pattern.finditer(line)
-        for op in op_iter:
-            #print(f"operation at {op.start()}: {op.group()}")
-            if op.group() == "don't()":
-                mul_is_enabled = False
-            elif op.group() == "do()":
-                mul_is_enabled = True
-            else:
+    tail = b''
+    for chunk in chunks:
+        memory = tail + chunk
+        scanned_to = 0
+        for op in INSTRUCTION.finditer(memory):
+            a, b, dont = op.groups()
+            if a is not None:
+                product = int(a) * int(b)
+                total += product
                 if mul_is_enabled:
-                    a,b = map(int, numbers.findall(op.group())[0].split(','))
-                    total += a * b
+                    enabled_total += product
+            else:
+                mul_is_enabled = dont is None
+            scanned_to = op.end()
+        # anything that could still be the start of an instruction
+        tail = memory[max(scanned_to, len(memory) - (LONGEST_INSTRUCTION - 1)):]
+    return total, enabled_total
+
+def memoryChunks(input_lines, chunk_size=CHUNK_SIZE):
+    # the mapped input file a chunk at a time, or the lines for plain str lines
+    data = getattr(input_lines, 'data', None)
+    if data is None:
+        # plain str lines (running this file directly)
+        yield from (f'{line}\n'.encode() for line in input_lines)
+        return
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+def part_1(input_lines) -> int:
+    # test answer = 161, answer = 175700056
+    total, _ = scanMemory(memoryChunks(input_lines))
     return total
 
+def part_2(input_lines) -> int:
+    # answer = 71668682
+    _, enabled_total = scanMemory(memoryChunks(input_lines))
+    return enabled_total
+
+def stream(chunks) -> tuple:
+    return scanMemory(chunks)
+
 
 if __name__ == "__main__":
     aoc_input = Path(__file__).with_name('input.txt')
@@ -57,4 +78,3 @@ if __name__ == "__main__":
 
     answer_2 = part_2(lines)
     print(f'part 2 answer: {answer_2}')
-    
\ No newline at end of file
@@ -0,0 +1,9 @@
+#----------------------------------------------------------
+# AoC 2024 Day 4 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = the side of the square word search
+    for _ in range(size):
+        yield ''.join(rng.choices('XMAS', k=size))
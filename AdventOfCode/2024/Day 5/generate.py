@@ -0,0 +1,21 @@
+#----------------------------------------------------------
+# AoC 2024 Day 5 - large input generator
+#----------------------------------------------------------
+
+
+PAGE_COUNT = 49
+
+
+def generate(size, rng):
+    # size = number of updates, the rules order every pair of pages
+    pages = rng.sample(range(10, 100), PAGE_COUNT)
+    for i in range(PAGE_COUNT):
+        for j in range(i + 1, PAGE_COUNT):
+            yield f'{pages[i]}|{pages[j]}'
+    yield ''
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            # a correctly ordered update
+            update.sort(key=pages.index)
+        yield ','.join(map(str, update))
@@ -2,92 +2,189 @@
 # AoC 2024 Day 5
 #----------------------------------------------------------
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import multiprocessing
+import sys
 
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.pools import pool_workers
+
+# updates handed to a worker process at a time, only full chunks go to
+# the pool so a small input never starts one
+CHUNK_UPDATES = 20000
+
+class PageRules:
+    # the X|Y rules compiled into one bitset per page, bit p is set in
+    # later[x] when page x has to come before page p, and in earlier[y]
+    # when page y has to come after page p, so checking a page against
+    # all the pages of an update is one AND
+    def __init__(self):
+        self.later = {}
+        self.earlier = {}
+
+    def add(self, page_before, page_after):
+        self.later[page_before] = self.later.get(page_before, 0) | (1 << page_after)
+        self.earlier[page_after] = self.earlier.get(page_after, 0) | (1 << page_before)
+
+def pageSet(pages) -> int:
+    page_set = 0
+    for page in pages:
+        page_set |= 1 << page
+    return page_set
 
 def updatesAreValid(pages, rules) -> bool:
-    # check each page against the rules to make sure that 
-    # pages are not out of order
-    for i in range(1, len(pages)):
-        check_page = pages[i]
-        for j in range(0, i):
-            if check_page in rules:
-                if pages[j] in rules[check_page]:
-                    # found a page that should come after the given page
-                    return False
+    # one pass, each page is checked against the pages already seen
+    # in a single AND rather than a loop over them
+    seen = 0
+    for page in pages:
+        if rules.later.get(page, 0) & seen:
+            # found a page that should come after the given page
+            return False
+        seen |= 1 << page
     return True
 
-def reorderPages(pages, rules):
-    # check the pages against the rules to find which rule is broken
-    # then reorder to fix it
-    for i in range(1, len(pages)):
-        check_page = pages[i]
-        for j in range(0, i):
-            if check_page in rules:
-                if pages[j] in rules[check_page]:
-                    # rule is broken, so fix it and check it
-                    pages[i], pages[j] = pages[j], pages[i]
-                    if updatesAreValid(pages, rules):
-                        # we're done
-                        return pages
-                    else:
-                        reorderPages(pages, rules)
-                        break
-    return pages
-
-def part_1(input_lines) -> int:
-    # answer = 4609
-    middle_total = 0
-    rules = {}
-    reading_rules = True
-    for line in input_lines:
-        # read rules until we get a blank line
-        if len(line) == 0:
-            reading_rules = False
-            continue
-        if reading_rules:
-            page_key, page_after = map(int, line.split('|'))
-            if page_key in rules:
-                rules[page_key].append(page_after)
-            else:
-                rules[page_key] = [page_after]
+def reorderPages(pages, rules) -> list:
+    # Kahn's topological sort, restricted to the update's own pages:
+    # a page can go next once no page still left has to come before it
+    left = pageSet(pages)
+    waiting = {page: (rules.earlier.get(page, 0) & left).bit_count() for page in pages}
+    ready = [page for page in pages if waiting[page] == 0]
+    ordered = []
+    while ready:
+        page = ready.pop()
+        ordered.append(page)
+        for later_page in pages:
+            if rules.later.get(page, 0) >> later_page & 1:
+                waiting[later_page] -= 1
+                if waiting[later_page] == 0:
+                    ready.append(later_page)
+    if len(ordered) != len(pages):
+        raise ValueError(f'the rules for update {pages} have a cycle')
+    return ordered
+
+def middlePage(pages, rules) -> int:
+    # when the rules order every pair of the update's pages, the page
+    # with exactly half the others before it is the middle one, so it can
+    # be picked out without sorting the update at all
+    page_set = pageSet(pages)
+    middle = (len(pages) - 1) // 2
+    pages_before = [(rules.earlier.get(page, 0) & page_set).bit_count() for page in pages]
+    if sorted(pages_before) == list(range(len(pages))):
+        return pages[pages_before.index(middle)]
+    # not a total order, so sort it properly
+    return reorderPages(pages, rules)[middle]
+
+def batchMiddleTotals(rules, updates) -> tuple:
+    # the middle page totals of the valid updates and of the corrected
+    # invalid ones, from one look at each update
+    valid_total = 0
+    fixed_total = 0
+    for pages in updates:
+        if updatesAreValid(pages, rules):
+            valid_total += pages[(len(pages) - 1) // 2]
         else:
-            pages = list(map(int, line.split(',')))
-            if updatesAreValid(pages, rules):
-                middle = int((len(pages) - 1)/2)
-                #print(f"line: {line} is valid! middle = {pages[middle]}")
-                middle_total += pages[middle]
-            else:
-                #print(f"line: {line} is NOT valid!")
+            fixed_total += middlePage(pages, rules)
+    return valid_total, fixed_total
+
+# the rules in each worker process, set once when it starts
+worker_rules = None
+
+def setWorkerRules(rules):
+    global worker_rules
+    worker_rules = rules
+
+def workerMiddleTotals(updates) -> tuple:
+    return batchMiddleTotals(worker_rules, updates)
+
+def middleTotals(rules, update_chunks, workers=None) -> tuple:
+    # both totals over chunks of updates, with full chunks spread across a
+    # process pool and only a few chunks waiting for a worker at a time
+    if workers is None:
+        workers = pool_workers()
+    totals = [0, 0]
+    def addTotals(chunk_totals):
+        totals[0] += chunk_totals[0]
+        totals[1] += chunk_totals[1]
+
+    pool = None
+    pending = deque()
+    try:
+        for updates in update_chunks:
+            if workers <= 1 or len(updates) < CHUNK_UPDATES:
+                addTotals(batchMiddleTotals(rules, updates))
                 continue
-    return middle_total
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                           initializer=setWorkerRules, initargs=(rules,))
+            pending.append(pool.submit(workerMiddleTotals, updates))
+            if len(pending) >= 2 * workers:
+                addTotals(pending.popleft().result())
+        while pending:
+            addTotals(pending.popleft().result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return tuple(totals)
+
+def updateChunks(updates):
+    updates = iter(updates)
+    while chunk := list(islice(updates, CHUNK_UPDATES)):
+        yield chunk
 
-def part_2(input_lines) -> int:
-    # answer = 5723
-    middle_total = 0
-    rules = {}
-    reading_rules = True
+class PrintQueue:
+    # the compiled rules and the updates, what parse() hands both parts.
+    # Both totals come out of the same look at each update, so totals()
+    # remembers them and a part called on the same queue doesn't redo it
+    def __init__(self, rules, updates):
+        self.rules = rules
+        self.updates = updates
+        self._totals = None
+
+    def totals(self) -> tuple:
+        if self._totals is None:
+            self._totals = middleTotals(self.rules, updateChunks(self.updates))
+        return self._totals
+
+def readRules(input_lines) -> PageRules:
+    # reads rules up to the blank line, leaving the updates still to read
+    rules = PageRules()
     for line in input_lines:
+        line = line.strip()
         # read rules until we get a blank line
         if len(line) == 0:
-            reading_rules = False
-            continue
-        if reading_rules:
-            page_key, page_after = map(int, line.split('|'))
-            if page_key in rules:
-                rules[page_key].append(page_after)
-            else:
-                rules[page_key] = [page_after]
-        else:
-            pages = list(map(int, line.split(',')))
-            if updatesAreValid(pages, rules):
-                #print(f"line: {line} is valid, but we're not using it")
-                continue
-            else:
-                fixed_pages = reorderPages(pages, rules)
-                middle = int((len(fixed_pages) - 1)/2)
-                #print(f"fixed line: {fixed_pages} - middle = {pages[middle]}")
-                middle_total += pages[middle]
-    return middle_total
+            break
+        page_before, page_after = map(int, line.split('|'))
+        rules.add(page_before, page_after)
+    return rules
+
+def readUpdates(input_lines):
+    return (list(map(int, line.split(','))) for line in input_lines if line.strip())
+
+def parse(input_lines) -> PrintQueue:
+    # the page ordering rules, then a blank line, then the updates
+    input_lines = iter(input_lines)
+    rules = readRules(input_lines)
+    return PrintQueue(rules, list(readUpdates(input_lines)))
+
+def part_1(print_queue) -> int:
+    # test answer = 143, answer = 4609
+    valid_total, _ = print_queue.totals()
+    return valid_total
+
+def part_2(print_queue) -> int:
+    # test answer = 123, answer = 5723
+    _, fixed_total = print_queue.totals()
+    return fixed_total
+
+def stream(input_lines) -> tuple:
+    # both parts in one pass, the rules are read first and then the
+    # updates are checked a chunk at a time as they're read
+    input_lines = iter(input_lines)
+    rules = readRules(input_lines)
+    return middleTotals(rules, updateChunks(readUpdates(input_lines)))
 
 if __name__ == "__main__":
     aoc_input = Path(__file__).with_name('input.txt')
@@ -96,10 +193,10 @@ if __name__ == "__main__":
     with aoc_input.open('r') as f:
        #lines = " ".join(line.rstrip() for line in file)
        lines = f.readlines()
-    lines = [x.strip() for x in lines]
-    answer_1 = part_1(lines)
+    print_queue = parse(lines)
+    answer_1 = part_1(print_queue)
     print(f'part 1 answer: {answer_1}')
 
-    answer_2 = part_2(lines)
+    answer_2 = part_2(print_queue)
     print(f'part 2 answer: {answer_2}')
     
\ No newline at end of file
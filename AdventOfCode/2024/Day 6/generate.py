@@ -0,0 +1,47 @@
+#----------------------------------------------------------
+# AoC 2024 Day 6 - large input generator
+#----------------------------------------------------------
+
+
+OBSTRUCTION_DENSITY = 0.03
+# up, right, down, left, turning right is the next one
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def loopingObstructions(lab, size, guard) -> list:
+    # walks the guard out of the lab, returns [] when it gets out, or the
+    # obstructions it keeps bumping into when it goes round in circles
+    r, c = guard
+    d = 0
+    turns = {}
+    bumped = []
+    while True:
+        dr, dc = DIRECTIONS[d]
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < size and 0 <= nc < size):
+            return []
+        if lab[nr][nc] != '#':
+            r, c = nr, nc
+            continue
+        state = (r, c, d)
+        if state in turns:
+            return bumped[turns[state]:]
+        turns[state] = len(bumped)
+        bumped.append((nr, nc))
+        d = (d + 1) % 4
+
+def generate(size, rng):
+    # size = the side of the square lab, the guard starts near the middle facing up
+    guard_r = guard_c = size // 2
+    lab = [['#' if rng.random() < OBSTRUCTION_DENSITY else '.' for _ in range(size)] for _ in range(size)]
+    lab[guard_r][guard_c] = '^'
+    if guard_r:
+        # nothing right in front of the guard
+        lab[guard_r - 1][guard_c] = '.'
+    # a big enough lab nearly always traps the guard, so take out one of
+    # the obstructions it circles until it gets out, which part 1 needs
+    while cycle := loopingObstructions(lab, size, (guard_r, guard_c)):
+        r, c = rng.choice(cycle)
+        lab[r][c] = '.'
+    for row in lab:
+        yield ''.join(row)
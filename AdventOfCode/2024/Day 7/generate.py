@@ -0,0 +1,21 @@
+#----------------------------------------------------------
+# AoC 2024 Day 7 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = number of equations, about half of them can be made true
+    for _ in range(size):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        total = numbers[0]
+        for number in numbers[1:]:
+            op = rng.choice('+*|')
+            if op == '+':
+                total += number
+            elif op == '*':
+                total *= number
+            else:
+                total = int(f'{total}{number}')
+        if rng.random() < 0.5:
+            total += rng.randint(1, 9)
+        yield f'{total}: ' + ' '.join(map(str, numbers))
@@ -2,72 +2,218 @@
 # AoC 2024 Day 7
 #----------------------------------------------------------
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import multiprocessing
+import sys
+import time
 
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import metrics
+from aoc.pools import pool_workers
 
-def convertToBase(number, base, width=1):
-    # baed on: https://stackoverflow.com/a/34559825/4717755
-    if number == 0:
-        return '0' * width
-    nums = []
-    while number:
-        number, rem = divmod(number, base)
-        nums.append(str(rem))
-    answer_without_padding = ''.join(reversed(nums))
-    padded_answer = answer_without_padding.zfill(width)
-    return padded_answer
 
+# a search budget to pass to calibrationTotal() when trying generated
+# inputs or operators like '//' that can branch a lot: a line whose search
+# looks at more (target, count) pairs than this is given up on rather than
+# left to run for ever. The parts run without one, every line is counted
+NODE_BUDGET = 1000000
+# below this many equations, starting a process pool costs more than it saves
+POOL_MIN_EQUATIONS = 5000
 
-def calculateNumbers(target, numbers, base=2) -> bool:
+
+class Operator:
+    '''
+    an operator that can go between two numbers:
+      forward(a, b) is a <op> b, and undo(target, b) gives every a with
+      a <op> b == target (or ANY_PREFIX when any a will do), which is all
+      the solver needs to work backwards from the target.
+      non_negative is True when non-negative a and b always give a
+      non-negative result, so a negative target can be dropped.
+    '''
+    def __init__(self, symbol, forward, undo, non_negative):
+        self.symbol = symbol
+        self.forward = forward
+        self.undo = undo
+        self.non_negative = non_negative
+
+    def __repr__(self) -> str:
+        return f'Operator({self.symbol!r})'
+
+ANY_PREFIX = 'any'
+OPERATORS = {}
+
+def registerOperator(symbol, forward, undo, non_negative=True) -> Operator:
+    operator = Operator(symbol, forward, undo, non_negative)
+    OPERATORS[symbol] = operator
+    return operator
+
+def digitsPower(number) -> int:
+    # the power of 10 that shifts a number left past all of its digits,
+    # so a || b == a * digitsPower(b) + b without going through strings
+    power = 10
+    while power <= number:
+        power *= 10
+    return power
+
+def undoMultiply(target, n):
+    if n == 0:
+        # anything times 0
+        return ANY_PREFIX if target == 0 else ()
+    return (target // n,) if target % n == 0 else ()
+
+def undoConcatenate(target, n):
+    power = digitsPower(n)
+    return (target // power,) if target % power == n else ()
+
+def undoDivide(target, n):
+    # every a in [target * n, target * n + n) has a // n == target, so
+    # this one can branch a lot, which is what the node budget is for
+    return range(target * n, target * n + n) if n > 0 else ()
+
+ADD = registerOperator('+', lambda a, b: a + b, lambda target, n: (target - n,)).symbol
+MULTIPLY = registerOperator('*', lambda a, b: a * b, undoMultiply).symbol
+CONCATENATE = registerOperator('||', lambda a, b: a * digitsPower(b) + b, undoConcatenate).symbol
+SUBTRACT = registerOperator('-', lambda a, b: a - b, lambda target, n: (target + n,), non_negative=False).symbol
+DIVIDE = registerOperator('//', lambda a, b: a // b, undoDivide).symbol
+XOR = registerOperator('^', lambda a, b: a ^ b, lambda target, n: (target ^ n,)).symbol
+PART_1_OPERATORS = (ADD, MULTIPLY)
+PART_2_OPERATORS = (ADD, MULTIPLY, CONCATENATE)
+
+
+class OverBudget(Exception):
+    pass
+
+class IncompleteTotal(Exception):
+    # some lines went over the search budget, so there's no true total,
+    # only the total of the other lines
+    def __init__(self, total, over_budget):
+        super().__init__(f'{len(over_budget)} lines over the search budget, the other lines total {total}')
+        self.total = total
+        self.over_budget = over_budget
+
+def solveEquation(target, numbers, operators=PART_2_OPERATORS, budget=None) -> tuple:
     '''
-    returns if the total calculated by applying the given operations
-      total_ops is the number of potential operations, which is
-      one less than the list of numbers.
+    returns (if the target can be made by putting the operators between
+      the numbers, evaluated left to right, and how many nodes it took).
+      Works right to left from the target instead of trying every
+      combination: the last number must have been combined with whatever
+      the numbers before it made, so each operator is undone to get what
+      that would have had to be, and only those are followed (target >= n
+      for +, n divides the target for *, the target ends in the digits of
+      n for ||) so most branches die straight away.
+      Raises OverBudget after more than budget nodes.
     '''
-    number_of_operation_places = len(numbers) - 1
-    total_ops = base**number_of_operation_places
-    for ops in range(total_ops):
-        # convert to a list of the current operations
-        # '0' represents addition
-        # '1' represents multiplication
-        # '2' represents concatenation
-        these_ops = convertToBase(ops, base, number_of_operation_places)
-        test_total = numbers[0]
-        i = 1
-        for op in list(these_ops):
-            if op == '0':
-                test_total += numbers[i]
-            elif op == '1':
-                test_total *= numbers[i]
-            elif op == '2':
-                test_total = int(str(test_total) + str(numbers[i]))
-            i += 1
-        if test_total == target:
-            # the operations matched the target valule, so return True
-            return True
-    return False
-
-def part_1(input_lines) -> int:
+    undos = [OPERATORS[symbol].undo for symbol in operators]
+    # with no way to go below 0, a negative target is a dead end
+    non_negative = all(OPERATORS[symbol].non_negative for symbol in operators) and min(numbers) >= 0
+    # (what the first count numbers have to make, count)
+    to_check = [(target, len(numbers))]
+    nodes = 0
+    while to_check:
+        target, count = to_check.pop()
+        nodes += 1
+        if budget is not None and nodes > budget:
+            raise OverBudget(nodes)
+        last = numbers[count - 1]
+        if count == 1:
+            if target == last:
+                return True, nodes
+            continue
+        for undo in undos:
+            prefixes = undo(target, last)
+            if prefixes is ANY_PREFIX:
+                return True, nodes
+            for prefix in prefixes:
+                if prefix >= 0 or not non_negative:
+                    to_check.append((prefix, count - 1))
+    return False, nodes
+
+def canMake(target, numbers, operators=PART_2_OPERATORS) -> bool:
+    return solveEquation(target, numbers, operators)[0]
+
+def checkEquations(equations, operators, budget=None) -> tuple:
+    # the total of the targets that can be made, and a
+    # (target, numbers, nodes, secs) report of the lines over budget
+    total = 0
+    over_budget = []
+    for target, numbers in equations:
+        start_time = time.perf_counter()
+        try:
+            matched, nodes = solveEquation(target, numbers, operators, budget)
+        except OverBudget as e:
+            over_budget.append((target, numbers, e.args[0], time.perf_counter() - start_time))
+            continue
+        metrics.count('day7.nodes', nodes)
+        if matched:
+            logging.debug("equation: %d: %s matches!", target, numbers)
+            total += target
+    return total, over_budget
+
+def workerCheckEquations(equations, operators, budget) -> tuple:
+    # the worker's metrics go back with its totals to be merged
+    metrics.reset()
+    return checkEquations(equations, operators, budget), metrics.snapshot()
+
+def calibrationTotal(equations, operators, budget=None, workers=None) -> int:
+    # every line is checked on its own, so with enough of them they're
+    # split across a process pool and the totals added up at the end.
+    # With a budget, lines that go over it raise IncompleteTotal rather
+    # than quietly leaving them out of the total
+    if workers is None:
+        workers = pool_workers()
+    if workers <= 1 or len(equations) < POOL_MIN_EQUATIONS:
+        total, over_budget = checkEquations(equations, operators, budget)
+    else:
+        shard_count = 4 * workers
+        shard_size = -(-len(equations) // shard_count)
+        shards = [equations[n:n + shard_size] for n in range(0, len(equations), shard_size)]
+        total = 0
+        over_budget = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as pool:
+            for (shard_total, shard_over_budget), shard_metrics in pool.map(
+                    workerCheckEquations, shards, [operators] * len(shards), [budget] * len(shards)):
+                total += shard_total
+                over_budget += shard_over_budget
+                metrics.merge(shard_metrics)
+    if over_budget:
+        for target, numbers, nodes, secs in over_budget:
+            logging.warning("over budget: %d: %s (%d nodes, %.3f secs)", target, numbers, nodes, secs)
+        raise IncompleteTotal(total, over_budget)
+    return total
+
+def parseEquation(line):
+    # "target: n1 n2 n3 ..."
+    target, numbers = line.split(':')
+    return int(target), list(map(int, numbers.split()))
+
+def parse(input_lines) -> list:
+    return [parseEquation(line) for line in input_lines if line.strip()]
+
+def part_1(equations) -> int:
     # test answer = 3749, answer = 6083020304036
-    sum_of_matched_totals = 0
-    for line in input_lines:
-        target_total = int(line.split(':')[0])
-        numbers = list(map(int, line.split(':')[1].split()))
-        if calculateNumbers(target_total, numbers, base=2):
-            logging.debug(f"line: {line} matches!")
-            sum_of_matched_totals += target_total
-    return sum_of_matched_totals
+    return calibrationTotal(equations, PART_1_OPERATORS)
+
+def part_2(equations) -> int:
+    # test answer = 11387, answer = 59002246504791
+    return calibrationTotal(equations, PART_2_OPERATORS)
 
-def part_2(input_lines) -> int:
-    # test answer = 11387, answer = xxxx
+def stream(input_lines) -> tuple:
+    # both parts in one pass over the equations
     sum_of_matched_totals = 0
+    sum_with_concatenation = 0
     for line in input_lines:
-        target_total = int(line.split(':')[0])
-        numbers = list(map(int, line.split(':')[1].split()))
-        if calculateNumbers(target_total, numbers, base=3):
-            logging.debug(f"line: {line} matches!")
+        if not line.strip():
+            continue
+        target_total, numbers = parseEquation(line)
+        if canMake(target_total, numbers, PART_1_OPERATORS):
+            # anything + and * can make, + * and || can make too
             sum_of_matched_totals += target_total
-    return sum_of_matched_totals
+            sum_with_concatenation += target_total
+        elif canMake(target_total, numbers, PART_2_OPERATORS):
+            sum_with_concatenation += target_total
+    return sum_of_matched_totals, sum_with_concatenation
 
 if __name__ == "__main__":
     # use logging so we can turn off debug printing
@@ -79,10 +225,10 @@ if __name__ == "__main__":
     with aoc_input.open('r') as f:
        #lines = " ".join(line.rstrip() for line in file)
        lines = f.readlines()
-    lines = [x.strip() for x in lines]
-    answer_1 = part_1(lines)
+    equations = parse(lines)
+    answer_1 = part_1(equations)
     print(f'part 1 answer: {answer_1}')
 
-    answer_2 = part_2(lines)
+    answer_2 = part_2(equations)
     print(f'part 2 answer: {answer_2}')
     
\ No newline at end of file
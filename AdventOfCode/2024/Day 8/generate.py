@@ -0,0 +1,14 @@
+#----------------------------------------------------------
+# AoC 2024 Day 8 - large input generator
+#----------------------------------------------------------
+import string
+
+FREQUENCIES = string.ascii_letters + string.digits
+ANTENNA_DENSITY = 0.01
+
+
+def generate(size, rng):
+    # size = the side of the square map
+    for _ in range(size):
+        yield ''.join(rng.choice(FREQUENCIES) if rng.random() < ANTENNA_DENSITY else '.'
+                      for _ in range(size))
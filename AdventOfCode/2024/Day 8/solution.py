@@ -2,140 +2,108 @@
 # AoC 2024 Day 8
 #----------------------------------------------------------
 from pathlib import Path
-import logging
+from array import array
 from itertools import combinations
-import numpy as np
-from scipy.spatial import distance
-
-
-class Point:
-    def __init__(self, new_freq):
-        self._freq = new_freq
-        self._antinode_count = 0
-
-    def isEmpty(self) -> bool:
-        return self._freq == '.'
-
-    def hasAntenna(self) -> bool:
-        return (self._freq != '.' and self._freq != '#')
-
-    def addAntiNode(self):
-        self._antinode_count += 1
-        self._freq = '#'
-
-    @property
-    def freq(self):
-        return self._freq
-
-    @property
-    def antinodeCount(self) -> int:
-        return self._antinode_count
-
-
-class Area:
-    def __init__(self, input_lines):
-        self._this_area = []
-        for line in input_lines:
-            this_row = list(Point(p) for p in list(line))
-            self._this_area.append(this_row)
-        self._width = len(self._this_area[0])
-        self._height = len(self._this_area)
-
-    def locateAntennas(self):
-        self._antennas = {}
-        for row, line in enumerate(self._this_area):
-            for col, point in enumerate(line):
-                if not point.isEmpty():
-                    if point.freq not in self._antennas:
-                        self._antennas[point.freq] = [(row,col)]
-                    else:
-                        self._antennas[point.freq].append((row,col))
-        logging.debug(f'antennas: {self._antennas.items()}')
-
-    def calcAntinodeLocations(self, freq, this_point, rise, run, which_side, limit_antinodes):
-        node_x = this_point[0]
-        node_y = this_point[1]
-        still_in_area = True
-        while still_in_area:
-            if which_side == 1:
-                node_x -= run
-                node_y -= rise
-            else:
-                node_x += run
-                node_y += rise
-            if ((node_x >= 0 and node_x < self._width) and
-                (node_y >= 0 and node_y < self._height)):
-                self._this_area[node_x][node_y].addAntiNode()
-                logging.debug(f'freq {freq} pair {this_point}: antinode at ({node_x}, {node_y})')
-            else:
-                still_in_area = False
-            if limit_antinodes:
-                still_in_area = False
-
-    def placeAntinodes(self, limit_anitnodes=True):
-        for freq in self._antennas:
-            pairs = list(combinations(self._antennas[freq], 2))
-            logging.debug(f'freq {freq}: {pairs}')
-            for pair in pairs:
-                pointA, pointB = pair
-                rise = pointB[1] - pointA[1]
-                run = pointB[0] - pointA[0]
-                # place anitnode on this side
-                self.calcAntinodeLocations(freq, pointA, rise, run, 1, limit_anitnodes)
-                self.calcAntinodeLocations(freq, pointB, rise, run, 2, limit_anitnodes)
-    
-    def countAntinodes(self) -> int:
-        total_count = 0
-        for row in self._this_area:
-            for point in row:
-                if point.antinodeCount > 0:
-                    total_count += 1
-        return total_count
-    
-    def countNonEmpty(self) -> int:
-        total_count = 0
-        for row in self._this_area:
-            for point in row:
-                if not point.isEmpty():
-                    total_count += 1
-        return total_count
-    
-    def print(self):
-        for row, line in enumerate(self._this_area):
-            printed_row = f'Row {row}: '
-            for col, point in enumerate(line):
-                printed_row += point.freq
-            logging.debug(printed_row)
-
-def part_1(input_lines) -> int:
+from math import gcd, inf
+import logging
+import re
+import sys
+
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid
+
+ANTENNA = re.compile(rb'[^.]')
+
+
+class AntennaMap:
+    # the map's size and, for each frequency, the rows and columns of its
+    # antennas, so the antinodes cost depends on the antennas, not the map
+    def __init__(self, width, height, antennas):
+        self.width = width
+        self.height = height
+        self.antennas = antennas
+
+    def index(self, row, col) -> int:
+        return row * self.width + col
+
+    def inBounds(self, row, col) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+def locateAntennas(grid) -> AntennaMap:
+    antennas = {}
+    for found in ANTENNA.finditer(grid.cells):
+        row, col = grid.coords(found.start())
+        rows, cols = antennas.setdefault(chr(found.group()[0]), (array('i'), array('i')))
+        rows.append(row)
+        cols.append(col)
+    logging.debug('antennas: %s', {freq: list(zip(*rows_cols)) for freq, rows_cols in antennas.items()})
+    return AntennaMap(grid.width, grid.height, antennas)
+
+def harmonicRange(position, step, size) -> tuple:
+    # the lowest and highest k where position + k * step is still on the map
+    if step == 0:
+        # never leaves the map this way, the other direction decides
+        return -inf, inf
+    lowest = -(position // step) if step > 0 else -((size - 1 - position) // -step)
+    highest = (size - 1 - position) // step if step > 0 else position // -step
+    return lowest, highest
+
+def pairAntinodes(antenna_map, rows, cols, resonant, antinodes):
+    # adds the linear indexes of the antinodes of every pair of antennas
+    # of one frequency to the antinodes set
+    width = antenna_map.width
+    for a, b in combinations(range(len(rows)), 2):
+        rise = rows[b] - rows[a]
+        run = cols[b] - cols[a]
+        if not resonant:
+            for row, col in ((rows[a] - rise, cols[a] - run), (rows[b] + rise, cols[b] + run)):
+                if antenna_map.inBounds(row, col):
+                    antinodes.add(row * width + col)
+            continue
+        # every cell in line counts, so step by the smallest whole step
+        common = gcd(rise, run)
+        rise //= common
+        run //= common
+        lowest_r, highest_r = harmonicRange(rows[a], rise, antenna_map.height)
+        lowest_c, highest_c = harmonicRange(cols[a], run, width)
+        lowest, highest = max(lowest_r, lowest_c), min(highest_r, highest_c)
+        # the cells in a line are evenly spaced linear indexes
+        step = rise * width + run
+        start = antenna_map.index(rows[a], cols[a])
+        antinodes.update(range(start + lowest * step, start + (highest + 1) * step, step))
+
+def countAntinodes(antenna_map, resonant=False) -> int:
+    antinodes = set()
+    for rows, cols in antenna_map.antennas.values():
+        pairAntinodes(antenna_map, rows, cols, resonant, antinodes)
+    return len(antinodes)
+
+def parse(input_lines):
+    return locateAntennas(Grid.from_lines(input_lines))
+
+def part_1(antenna_map) -> int:
     # test answer = 14, answer = 367
-    this_area = Area(input_lines)
-    this_area.locateAntennas()
-    this_area.placeAntinodes()
-    return this_area.countAntinodes()
+    return countAntinodes(antenna_map)
 
-def part_2(input_lines) -> int:
+def part_2(antenna_map) -> int:
     # test answer = 34, answer = 1285
-    this_area = Area(input_lines)
-    this_area.locateAntennas()
-    this_area.placeAntinodes(limit_anitnodes=False)
-    this_area.print()
-    return this_area.countNonEmpty()
+    return countAntinodes(antenna_map, resonant=True)
 
 if __name__ == "__main__":
     # use logging so we can turn off debug printing
     logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 
     aoc_input = Path(__file__).with_name('input.txt')
-    #aoc_input = Path(__file__).with_name('input_test.txt') 
+    #aoc_input = Path(__file__).with_name('input_test.txt')
     print(f'reading from: {aoc_input}')
     with aoc_input.open('r') as f:
        #lines = " ".join(line.rstrip() for line in file)
        lines = f.readlines()
     lines = [x.strip() for x in lines]
-    answer_1 = part_1(lines)
+    antenna_map = parse(lines)
+    answer_1 = part_1(antenna_map)
     print(f'part 1 answer: {answer_1}')
 
-    answer_2 = part_2(lines)
+    answer_2 = part_2(antenna_map)
     print(f'part 2 answer: {answer_2}')
-    
\ No newline at end of file
@@ -0,0 +1,12 @@
+#----------------------------------------------------------
+# AoC 2024 Day 9 - large input generator
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    # size = number of digits in the disk map (files and free space alternate)
+    digits = []
+    for i in range(size):
+        # files are at least one block, free space can be empty
+        digits.append(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)))
+    yield ''.join(digits)
@@ -3,6 +3,11 @@
 #----------------------------------------------------------
 from pathlib import Path
 import logging
+import sys
+
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.loader import open_input
 
 AOC_DAY_NUMBER = 0
 
@@ -22,10 +27,8 @@ if __name__ == "__main__":
     #aoc_input = Path(__file__).with_name('input.txt')
     aoc_input = Path(__file__).with_name('input_test.txt')
     print(f'reading from: {aoc_input}')
-    lines = []
-    with aoc_input.open('r', encoding="utf-8") as f:
-        lines = f.readlines()
-    lines = [x.strip() for x in lines]
+    # memory-mapped and decoded a line at a time, instead of f.readlines()
+    lines = open_input(aoc_input).stripped()
     answer1 = part_1(lines)
     print(f'AOC Day {AOC_DAY_NUMBER} part 1 answer: {answer1}')
 
@@ -0,0 +1,9 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 1 - large input generator              """
+#----------------------------------------------------------
+
+
+def generate(size, rng):
+    """ size = number of dial rotations """
+    for _ in range(size):
+        yield f'{rng.choice("LR")}{rng.randint(1, 999)}'
@@ -3,8 +3,13 @@
 #----------------------------------------------------------
 from pathlib import Path
 import logging
+import sys
 from collections import deque
 
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import metrics
+
 AOC_day_number = 1
 
 MAX_DIAL_SIZE = 100
@@ -19,7 +24,6 @@ def part_1(input_lines) -> int:
     dial.rotate(-1 * DIAL_START)
     for line in input_lines:
         # assume we're turning LEFT, unless we're turning RIGHT
-        print(f'Dial at {dial[0]}, turn {line}')
         direction = 1
         if line[0] == 'R':
             direction = -1
@@ -27,6 +31,7 @@ def part_1(input_lines) -> int:
         dial.rotate(direction * clicks)
         if dial[0] == TARGET_NUMBER:
             target_count += 1
+    metrics.count('day1.turns', len(input_lines))
     return target_count
 
 def part_2(input_lines) -> int:
@@ -47,11 +52,33 @@ def part_2(input_lines) -> int:
             range_check = dial[0] + (-direction * (clicks % MAX_DIAL_SIZE))
             if (range_check <= 0) or (range_check >= MAX_DIAL_SIZE):
                 passes_zero += 1
-        print(f'Dial at {dial[0]}, turn {line} - passes zero {passes_zero}, range check {range_check}')
         dial.rotate(direction * clicks)
         target_count += passes_zero
+    metrics.count('day1.turns', len(input_lines))
     return target_count
 
+def stream(input_lines) -> tuple:
+    """ both parts in one pass, tracking the dial as a number instead of a deque """
+    dial = DIAL_START
+    target_count = 0
+    passes_zero_count = 0
+    for line in input_lines:
+        line = line.strip()
+        if not line:
+            continue
+        clicks = int(line[1:])
+        # the dial numbers go down turning LEFT and up turning RIGHT
+        turn = -clicks if line[0] == 'L' else clicks
+        passes_zero_count += clicks // MAX_DIAL_SIZE
+        if dial != 0:
+            range_check = dial + (clicks % MAX_DIAL_SIZE) * (1 if turn > 0 else -1)
+            if (range_check <= 0) or (range_check >= MAX_DIAL_SIZE):
+                passes_zero_count += 1
+        dial = (dial + turn) % MAX_DIAL_SIZE
+        if dial == TARGET_NUMBER:
+            target_count += 1
+    return target_count, passes_zero_count
+
 if __name__ == "__main__":
     # use logging so we can turn off debug printing
     logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
@@ -0,0 +1,16 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 2 - large input generator              """
+#----------------------------------------------------------
+
+
+RANGE_COUNT = 30
+
+
+def generate(size, rng):
+    """ size = total number of IDs covered by the ranges (all on one comma separated line) """
+    ranges = []
+    for _ in range(RANGE_COUNT):
+        width = max(1, size // RANGE_COUNT)
+        lower = rng.randint(1, 10 ** rng.randint(2, 12))
+        ranges.append(f'{lower}-{lower + width - 1}')
+    yield ','.join(ranges)
@@ -6,8 +6,33 @@ import logging
 import re
 
 AOC_DAY_NUMBER = 2
+# the ranges are streamed one at a time instead of as one long line
+STREAM_SEPARATOR = ','
 
 
+def parse(input_lines) -> list:
+    """ the ID ranges are all on one comma separated line """
+    return input_lines[0].split(',')
+
+def is_doubled(vstr) -> bool:
+    """ the ID is some digits repeated exactly twice """
+    # the check only works if there are two equal length strings
+    if len(vstr) % 2 == 0:
+        half_vlen = int(len(vstr)/2)
+        return vstr[0:half_vlen] == vstr[half_vlen:]
+    return False
+
+def is_repeated(vstr) -> bool:
+    """ the ID is some digits repeated at least twice """
+    match = re.search(r'(.+)\1+', vstr)
+    if match:
+        if match.group() == vstr:
+            return True
+        match = re.search(r'(.+?)\1+', vstr)
+        if match:
+            return match.group() == vstr
+    return False
+
 def part_1(input_lines) -> int:
     """ AoC Part 1 Solution: test answer = 1227775554, answer = 21898734247  """
     invalid_id_sum = 0
@@ -15,13 +40,8 @@ def part_1(input_lines) -> int:
         lbound, ubound = map(int, line.split('-'))
         #print(f'from {lbound} to {ubound}: {ubound - lbound} values to check')
         for value in range(lbound, ubound+1):
-            vstr = str(value)
-            # the check only works if there are two equal length strings
-            if len(vstr) % 2 == 0:
-                half_vlen = int(len(vstr)/2)
-                if vstr[0:half_vlen] == vstr[half_vlen:]:
-                    #print(f'  --- found {vstr}')
-                    invalid_id_sum += value
+            if is_doubled(str(value)):
+                invalid_id_sum += value
     return invalid_id_sum
 
 def part_2(input_lines) -> int:
@@ -30,20 +50,29 @@ def part_2(input_lines) -> int:
     for line in input_lines:
         lbound, ubound = map(int, line.split('-'))
         for value in range(lbound, ubound+1):
-            vstr = str(value)
-            match = re.search(r'(.+)\1+', vstr)
-            if match:
-                if match.group() == vstr:
-                    #print(f'1 found {value}')
-                    invalid_id_sum += value
-                else:
-                    match = re.search(r'(.+?)\1+', vstr)
-                    if match:
-                        if match.group() == vstr:
-                            #print(f'2 found {value}')
-                            invalid_id_sum += value
+            if is_repeated(str(value)):
+                invalid_id_sum += value
     return invalid_id_sum
 
+def stream(input_lines) -> tuple:
+    """ both parts in one pass over the ID ranges """
+    doubled_id_sum = 0
+    repeated_id_sum = 0
+    for line in input_lines:
+        line = line.strip()
+        if not line:
+            continue
+        lbound, ubound = map(int, line.split('-'))
+        for value in range(lbound, ubound+1):
+            vstr = str(value)
+            if is_doubled(vstr):
+                # a doubled ID is a repeated ID too
+                doubled_id_sum += value
+                repeated_id_sum += value
+            elif is_repeated(vstr):
+                repeated_id_sum += value
+    return doubled_id_sum, repeated_id_sum
+
 if __name__ == "__main__":
     # use logging so we can turn off debug printing
     logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
@@ -53,7 +82,7 @@ if __name__ == "__main__":
     print(f'reading from: {aoc_input}')
     with aoc_input.open('r', encoding="utf-8") as f:
         lines = f.readlines()
-    lines = lines[0].split(',')
+    lines = parse(lines)
     answer_1 = part_1(lines)
     print(f'AOC Day {AOC_DAY_NUMBER} part 1 answer: {answer_1}')
 
@@ -0,0 +1,12 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 3 - large input generator              """
+#----------------------------------------------------------
+
+
+BANK_SIZE = 100
+
+
+def generate(size, rng):
+    """ size = number of battery banks """
+    for _ in range(size):
+        yield ''.join(rng.choices('123456789', k=BANK_SIZE))
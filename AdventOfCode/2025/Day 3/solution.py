@@ -3,6 +3,11 @@
 #----------------------------------------------------------
 from pathlib import Path
 import logging
+import sys
+
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import metrics
 
 AOC_DAY_NUMBER = 3
 
@@ -105,7 +110,6 @@ def part_2(input_lines) -> int:
     REQ_BATT_LEN = 12
     for line in input_lines:
         full_sequence = list(map(int, list(line)))
-        print(f'testing sequence {seq_number}: {line}')
         seq_number += 1
 
         # first, find the highest value that occurs BEFORE the last REQ_BATT_LEN
@@ -123,10 +127,9 @@ def part_2(input_lines) -> int:
                 this_sequence = full_sequence[full_start_index:end_index]
             else:
                 this_sequence = full_sequence[full_start_index:]
-            print(f'\tmax value at {max_nums[0]}, joltage = {joltage_str}')
         max_joltage = int(joltage_str)
-        print(f'\tmax joltage {max_joltage}')
         total_joltage += max_joltage
+    metrics.count('day3.banks', seq_number - 1)
     return total_joltage
 
 if __name__ == "__main__":
@@ -0,0 +1,12 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 4 - large input generator              """
+#----------------------------------------------------------
+
+
+ROLL_DENSITY = 0.6
+
+
+def generate(size, rng):
+    """ size = the side of the square map of paper rolls """
+    for _ in range(size):
+        yield ''.join('@' if rng.random() < ROLL_DENSITY else '.' for _ in range(size))
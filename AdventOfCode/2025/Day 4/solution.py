@@ -3,53 +3,49 @@
 #----------------------------------------------------------
 from pathlib import Path
 import logging
+import sys
+
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid
 
 AOC_DAY_NUMBER = 4
 
+ROLL = ord('@')
+MOVEABLE_ROLL = ord('x')
+
 
 def print_paper_map(paper_map):
     """ pretty printing of the map """
     print('===============   Paper Map ===================')
-    for row in paper_map:
-        print(''.join(row))
+    print(paper_map.dump())
 
 
-def paper_rolls_around_this_spot(paper_map, r, c) -> int:
+def paper_rolls_around_this_spot(paper_map, i) -> int:
     """ Counts the number of paper rolls that surround the given spot """
-    paper_roll = []
-    if r > 0:
-        if c > 0:
-            paper_roll.append(paper_map[r-1][c-1])
-        paper_roll.append(paper_map[r-1][c  ])
-        if c < len(paper_map[r]) - 1:
-            paper_roll.append(paper_map[r-1][c+1])
-
-    if c > 0:
-        paper_roll.append(paper_map[r  ][c-1])
-    if c < len(paper_map[r]) - 1:
-        paper_roll.append(paper_map[r  ][c+1])
-
-    if r < len(paper_map) - 1:
-        if c > 0:
-            paper_roll.append(paper_map[r+1][c-1])
-        paper_roll.append(paper_map[r+1][c  ])
-        if c < len(paper_map[r]) - 1:
-            paper_roll.append(paper_map[r+1][c+1])
-
-    return paper_roll.count('@') + paper_roll.count('x')
+    # the map is padded, so every spot has all 8 neighbors without bounds checks
+    cells = paper_map.cells
+    paper_rolls = 0
+    for step in paper_map.offsets8:
+        if cells[i + step] == ROLL or cells[i + step] == MOVEABLE_ROLL:
+            paper_rolls += 1
+    return paper_rolls
 
 def count_moveable_rolls_and_update(paper_map) -> int:
+    """ marks every roll with fewer than 4 neighboring rolls with an 'x' """
     moveable_rolls = 0
-    for r, row in enumerate(paper_map):
-        for c, spot in enumerate(row):
-            if paper_map[r][c] == '@' or paper_map[r][c] == 'x':
-                rolls_around = paper_rolls_around_this_spot(paper_map, r, c)
-                if rolls_around < 4:
-                    paper_map[r][c] = 'x'
-                    moveable_rolls += 1
+    # a roll marked 'x' still counts as a roll, so the order doesn't matter
+    for i in paper_map.find_all(ROLL) + paper_map.find_all(MOVEABLE_ROLL):
+        if paper_rolls_around_this_spot(paper_map, i) < 4:
+            paper_map.cells[i] = MOVEABLE_ROLL
+            moveable_rolls += 1
     #print_paper_map(paper_map)
     return moveable_rolls
 
+def parse(input_lines):
+    """ build up the map of the paper rolls """
+    return Grid.from_lines(input_lines, pad='.')
+
 def part_1(paper_map) -> int:
     """ AoC Part 1 Solution: test answer = 13, answer = 1505  """
     return count_moveable_rolls_and_update(paper_map)
@@ -61,10 +57,7 @@ def part_2(paper_map) -> int:
     while moveable_rolls > 0:
         total_moveable_rolls += moveable_rolls
         # replace all the 'x' marks with '.'
-        for r, row in enumerate(paper_map):
-            for c, spot in enumerate(row):
-                if spot == 'x':
-                    paper_map[r][c] = '.'
+        paper_map.cells[:] = paper_map.cells.replace(b'x', b'.')
         #print(f'\tmoved {moveable_rolls} rolls')
         moveable_rolls = count_moveable_rolls_and_update(paper_map)
     return total_moveable_rolls
@@ -79,12 +72,7 @@ if __name__ == "__main__":
     lines = []
     with aoc_input.open('r', encoding="utf-8") as f:
         lines = f.readlines()
-    lines = [x.strip() for x in lines]
-
-    # build up the map of the paper rolls
-    paper_map = []
-    for line in lines:
-        paper_map.append(list(line))
+    paper_map = parse(lines)
 
     answer1 = part_1(paper_map)
     print(f'AOC Day {AOC_DAY_NUMBER} part 1 answer: {answer1}')
@@ -0,0 +1,22 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 5 - large input generator              """
+#----------------------------------------------------------
+
+
+MAX_ID = 10 ** 15
+
+
+def generate(size, rng):
+    """ size = number of ingredient IDs, with a fresh range for every 5 of them """
+    id_ranges = []
+    for _ in range(max(1, size // 5)):
+        lower = rng.randint(1, MAX_ID)
+        id_ranges.append((lower, lower + rng.randint(0, MAX_ID // 1000)))
+        yield f'{id_ranges[-1][0]}-{id_ranges[-1][1]}'
+    yield ''
+    for _ in range(size):
+        if rng.random() < 0.5:
+            # a fresh ingredient
+            yield str(rng.randint(*rng.choice(id_ranges)))
+        else:
+            yield str(rng.randint(1, MAX_ID))
@@ -7,6 +7,22 @@ import logging
 AOC_DAY_NUMBER = 5
 
 
+def parse(input_lines):
+    """ splits the input into the fresh ID ranges and the ingredient IDs """
+    id_ranges = []
+    ingredient_ids = []
+    still_compiling_ranges = True
+    for line in input_lines:
+        line = line.strip()
+        if still_compiling_ranges:
+            if len(line) == 0:
+                still_compiling_ranges = False
+            else:
+                id_ranges.append([int(val) for val in line.split('-')])
+        else:
+            ingredient_ids.append(int(line))
+    return id_ranges, ingredient_ids
+
 def part_1(id_ranges, ingredient_ids) -> int:
     """ AoC Part 1 Solution: test answer = 3, answer = 782  """
     fresh_ingredients = 0
@@ -64,19 +80,7 @@ if __name__ == "__main__":
     lines = []
     with aoc_input.open('r', encoding="utf-8") as f:
         lines = f.readlines()
-    lines = [x.strip() for x in lines]
-
-    id_ranges = []
-    ingredient_ids = []
-    still_compiling_ranges = True
-    for line in lines:
-        if still_compiling_ranges:
-            if len(line) == 0:
-                still_compiling_ranges = False
-            else:
-                id_ranges.append([int(val) for val in line.split('-')])
-        else:
-            ingredient_ids.append(int(line))
+    id_ranges, ingredient_ids = parse(lines)
 
     answer1 = part_1(id_ranges, ingredient_ids)
     print(f'AOC Day {AOC_DAY_NUMBER} part 1 answer: {answer1}')
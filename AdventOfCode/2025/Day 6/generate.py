@@ -0,0 +1,25 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 6 - large input generator              """
+#----------------------------------------------------------
+
+
+NUMBER_ROWS = 4
+
+
+def generate(size, rng):
+    """ size = number of problems, each a column of numbers with its operator underneath """
+    rows = [[] for _ in range(NUMBER_ROWS)]
+    operators = []
+    for _ in range(size):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(NUMBER_ROWS)]
+        # longest at the top or at the bottom, so the digits in a column never have a gap
+        numbers.sort(key=len, reverse=rng.random() < 0.5)
+        width = max(len(number) for number in numbers)
+        # a problem's numbers are either all left or all right aligned
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        operators.append(rng.choice('*+').ljust(width))
+    for row in rows:
+        yield ' '.join(row)
+    yield ' '.join(operators)
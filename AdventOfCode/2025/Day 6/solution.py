@@ -7,6 +7,10 @@ import logging
 AOC_DAY_NUMBER = 6
 
 
+def parse(input_lines) -> list:
+    """ the column alignment matters, so the lines are used as-is (not stripped) """
+    return input_lines
+
 def part_1(input_lines) -> int:
     """ AoC Part 1 Solution: test answer = 4277556, answer = 6503327062445  """
     in_lines = [x.strip() for x in input_lines]
@@ -79,6 +83,67 @@ def part_2(input_lines) -> int:
     #print(f'column total {column_total}')
     return grand_total
 
+def apply_operation(math_operation, values) -> int:
+    if math_operation == '*':
+        column_total = 1
+        for value in values:
+            column_total *= value
+        return column_total
+    return sum(values)
+
+def stream(input_lines) -> tuple:
+    """ both parts in one pass, keeping running values per column instead of the rows
+
+    The operations are on the last line, so every column keeps both its
+    sum and its product for part 1, and for part 2 every character column
+    builds its number up a digit at a time, top to bottom.
+    """
+    column_sums = []
+    column_products = []
+    char_values = []
+    char_has_digit = []
+    for line in input_lines:
+        line = line.rstrip('\n')
+        if not line.strip():
+            continue
+        if not line.strip()[0].isdigit():
+            math_operations = line.split()
+            break
+        for i, val in enumerate(line.split()):
+            if i == len(column_sums):
+                column_sums.append(0)
+                column_products.append(1)
+            column_sums[i] += int(val)
+            column_products[i] *= int(val)
+        if len(line) > len(char_values):
+            char_values.extend([0] * (len(line) - len(char_values)))
+            char_has_digit.extend([False] * (len(line) - len(char_has_digit)))
+        for c, val in enumerate(line):
+            if val.isdigit():
+                char_values[c] = char_values[c] * 10 + int(val)
+                char_has_digit[c] = True
+    else:
+        return 0, 0
+
+    grand_total_1 = 0
+    for i, math_operation in enumerate(math_operations):
+        grand_total_1 += column_sums[i] if math_operation == '+' else column_products[i]
+
+    # a character column without any digits separates the problems
+    grand_total_2 = 0
+    problem = 0
+    column_values = []
+    for value, has_digit in zip(char_values, char_has_digit):
+        if has_digit:
+            column_values.append(value)
+        elif column_values:
+            grand_total_2 += apply_operation(math_operations[problem], column_values)
+            problem += 1
+            column_values = []
+    if column_values:
+        grand_total_2 += apply_operation(math_operations[problem], column_values)
+    return grand_total_1, grand_total_2
+
 if __name__ == "__main__":
     # use logging so we can turn off debug printing
     logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
@@ -0,0 +1,19 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 7 - large input generator              """
+#----------------------------------------------------------
+
+
+SPLITTER_DENSITY = 0.3
+
+
+def generate(size, rng):
+    """ size = the width of the manifold, which is twice as tall, with splitters on every other row """
+    width = size | 1
+    row = ['.'] * width
+    row[width // 2] = 'S'
+    yield ''.join(row)
+    for r in range(1, 2 * width):
+        if r % 2 == 0:
+            yield ''.join('^' if rng.random() < SPLITTER_DENSITY else '.' for _ in range(width))
+        else:
+            yield '.' * width
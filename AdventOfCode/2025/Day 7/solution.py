@@ -4,56 +4,66 @@
 from pathlib import Path
 import logging
 import re
+import sys
 from collections import deque
 
+# the shared helpers live in AdventOfCode/aoc
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid
+
 
 AOC_DAY_NUMBER = 7
 
+EMPTY = ord('.')
+BEAM = ord('|')
+SPLITTER = ord('^')
+
 
 def print_this(manifold):
     """ pretty prints the given manifold """
-    for row in manifold:
-        print(row)
-
-def part_1(input_lines) -> int:
-    """ AoC Part 1 Solution: test answer = 21, answer = 1524  """
-    manifold = input_lines.copy()
-    beam_index = -1
-    for row, line in enumerate(manifold):
-        if row == 0:
-            # start the beam...
-            beam_index = manifold[row].find('S')
-        elif row == 1:
-            # place the first beam
-            manifold[row] = manifold[row][:beam_index] + '|' + manifold[row][beam_index + 1:]
-        elif row % 2 == 0:
-            # splitters only occur on EVEN numbered rows, so locate them ... 
-            splitters = [match.start() for match in re.finditer('\\^', manifold[row])]
+    print(manifold.dump())
+
+def columns_of(manifold, row, pattern) -> list:
+    """ the columns in the given manifold row that match the (bytes) pattern """
+    return [match.start() for match in re.finditer(pattern, manifold.row(row))]
+
+def trace_beams(input_lines):
+    """ marks the beam paths through the manifold and counts the splits,
+        returns the split count and the marked-up manifold """
+    manifold = Grid.from_lines(input_lines)
+    # start the beam and place the first beam below it
+    beam_index = manifold.row(0).find(b'S')
+    manifold[1, beam_index] = BEAM
+    for row in range(2, manifold.height):
+        if row % 2 == 0:
+            # splitters only occur on EVEN numbered rows, so locate them ...
             # ... and set the new beams
-            for split_index in splitters:
-                manifold[row] = manifold[row][:split_index - 1] + '|' + manifold[row][split_index:]
-                manifold[row] = manifold[row][:split_index + 1] + '|' + manifold[row][split_index + 2:]
+            for split_index in columns_of(manifold, row, rb'\^'):
+                manifold[row, split_index - 1] = BEAM
+                manifold[row, split_index + 1] = BEAM
             # don't forget to continue any unsplit beams from the previous row
-            beams = [match.start() for match in re.finditer('\\|', manifold[row - 1])]
-            for beam_index in beams:
-                if manifold[row][beam_index] == '.':
-                    manifold[row] = manifold[row][:beam_index] + '|' + manifold[row][beam_index + 1:]
-        elif row % 2 != 0:
+            for beam_index in columns_of(manifold, row - 1, rb'\|'):
+                if manifold[row, beam_index] == EMPTY:
+                    manifold[row, beam_index] = BEAM
+        else:
             # the odd rows just mark the beam travel from the previous row, so
             # carry down the beams from above
-            beams = [match.start() for match in re.finditer('\\|', manifold[row - 1])]
-            for beam_index in beams:
-                manifold[row] = manifold[row][:beam_index] + '|' + manifold[row][beam_index + 1:]
+            for beam_index in columns_of(manifold, row - 1, rb'\|'):
+                manifold[row, beam_index] = BEAM
     #print_this(manifold)
     # now count how many splitters have a beam as an input
     split_total = 0
-    for row in range(2, len(manifold), 2):
-        splitters = [match.start() for match in re.finditer('\\^', manifold[row])]
-        for splitter_index in splitters:
-            if manifold[row - 1][splitter_index] == '|':
+    for row in range(2, manifold.height, 2):
+        for splitter_index in columns_of(manifold, row, rb'\^'):
+            if manifold[row - 1, splitter_index] == BEAM:
                 split_total += 1
     return split_total, manifold
 
+def part_1(input_lines) -> int:
+    """ AoC Part 1 Solution: test answer = 21, answer = 1524  """
+    split_total, _ = trace_beams(input_lines)
+    return split_total
+
 
 class SplitterNode():
     """ tracks splitter node location in the graph """
@@ -114,31 +124,30 @@ def count_paths(the_graph, first_node, last_node):
 
 
 
-def part_2(manifold) -> int:
+def part_2(input_lines) -> int:
     """ AoC Part 2 Solution: test answer = 40, answer = 32982105837605  """
-    # use the manifold created in Part 1 to create a graph database
+    # use the manifold traced out for Part 1 to create a graph database
     # of all node connections
     #   node are mapped by row/column, with a uniquely generated ID
     #   nodes are stored in the dictionary with a generated key value
     #        key value = "row-col"
     #   when the entire manifold is mapped, all beams terminate in
     #        a "final" node (row number is > last row of manifold)
+    _, manifold = trace_beams(input_lines)
     graph = {}
-    final_node = SplitterNode(len(manifold) + 1, 0)
-    for row, line in enumerate(manifold):
-        if row >= 2:
-            splitters = [match.start() for match in re.finditer('\\^', line)]
-            for splitter_index in splitters:
-                newSplitter = SplitterNode(row, splitter_index)
-                graph[newSplitter.key] = newSplitter
+    final_node = SplitterNode(manifold.height + 1, 0)
+    for row in range(2, manifold.height):
+        for splitter_index in columns_of(manifold, row, rb'\^'):
+            newSplitter = SplitterNode(row, splitter_index)
+            graph[newSplitter.key] = newSplitter
     graph[final_node.key] = final_node
     # now connect the nodes
     for node_key, node in graph.items():
         # follow the left split beam...
         for beam in [node.col - 1, node.col + 1]:
             child_key = ''
-            for r in range(node.row + 2, len(manifold), 2):
-                if manifold[r][beam] == '^':
+            for r in range(node.row + 2, manifold.height, 2):
+                if manifold[r, beam] == SPLITTER:
                     child_key = str(r) + '-' + str(beam)
                     break
             if child_key == '':
@@ -167,8 +176,8 @@ if __name__ == "__main__":
     with aoc_input.open('r', encoding="utf-8") as f:
         lines = f.readlines()
     lines = [x.strip() for x in lines]
-    answer1, manifold = part_1(lines)
+    answer1 = part_1(lines)
     print(f'AOC Day {AOC_DAY_NUMBER} part 1 answer: {answer1}')
 
-    answer2 = part_2(manifold)
+    answer2 = part_2(lines)
     print(f'AOC Day {AOC_DAY_NUMBER} part 2 answer: {answer2}')
@@ -0,0 +1,12 @@
+#----------------------------------------------------------
+""" AoC 2025 Day 8 - large input generator              """
+#----------------------------------------------------------
+
+
+MAX_COORD = 99999
+
+
+def generate(size, rng):
+    """ size = number of junction boxes """
+    for _ in range(size):
+        yield ','.join(str(rng.randint(0, MAX_COORD)) for _ in range(3))
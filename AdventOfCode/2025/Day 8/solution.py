@@ -113,10 +113,11 @@ def part_1(input_lines) -> int:
     circuit_length_result = 1
     for i in range(3):
         circuit_length_result *= lengths[i]
-    return circuit_length_result, distances, points
+    return circuit_length_result
 
-def part_2(distances, number_of_points) -> int:
+def part_2(input_lines) -> int:
     """ AoC Part 2 Solution: test answer = 25272, answer = 1131823407  """
+    points, distances = compute_all_distances(input_lines)
     # now figure out the circuits
     circuits = []
     for distance_key, distance in distances.items():
@@ -175,8 +176,8 @@ if __name__ == "__main__":
     with aoc_input.open('r', encoding="utf-8") as f:
         lines = f.readlines()
     lines = [x.strip() for x in lines]
-    answer1, distances_list, points = part_1(lines)
+    answer1 = part_1(lines)
     print(f'AOC Day {AOC_DAY_NUMBER} part 1 answer: {answer1}')
 
-    answer2 = part_2(distances_list, points)
+    answer2 = part_2(lines)
     print(f'AOC Day {AOC_DAY_NUMBER} part 2 answer: {answer2}')
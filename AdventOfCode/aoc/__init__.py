@@ -0,0 +1,5 @@
+"""Shared tooling for running the Advent of Code solutions.
+
+The solutions themselves stay as plain scripts in <year>/Day N/solution.py
+so each one can still be run by hand. This package finds and drives them.
+"""
@@ -0,0 +1,28 @@
+"""Command line entry point, run from the AdventOfCode folder:  python -m aoc <command> ..."""
+
+import argparse
+import logging
+import sys
+
+from aoc import bench, generators, importtime, runner, streaming, tracker
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='aoc', description='Advent of Code solution tools')
+    parser.add_argument('--debug', action='store_true', help='turn on debug logging')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    runner.add_parser(subparsers)
+    bench.add_parser(subparsers)
+    tracker.add_parser(subparsers)
+    streaming.add_parser(subparsers)
+    importtime.add_parser(subparsers)
+    generators.add_parser(subparsers)
+    args = parser.parse_args()
+    # use logging so we can turn off debug printing
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format='%(levelname)s - %(message)s')
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Reads the expected answers that the solutions note down for themselves.
+
+The answers live in the part functions as a comment or docstring, e.g.
+
+    # test answer = 41, data answer = 5239
+    \"\"\" AoC Part 1 Solution: test answer = 357, answer = 17427  \"\"\"
+
+Placeholders such as "answer = xxxx" are skipped. The solution is parsed
+with ast rather than imported, so nothing in it gets run.
+"""
+
+import ast
+import re
+
+from aoc.days import PARTS
+
+ANSWER_NOTE = re.compile(r'(test answer|data answer|answer)\s*(?:\([^)]*\))?\s*=\s*(\d+)?')
+
+
+def notes_for(function_node, source_lines) -> str:
+    """ collects the docstring and comment text of a function """
+    notes = [ast.get_docstring(function_node) or '']
+    for line in source_lines[function_node.lineno - 1:function_node.end_lineno]:
+        if '#' in line:
+            notes.append(line[line.index('#') + 1:])
+    return '\n'.join(notes)
+
+
+def parse_notes(text) -> dict:
+    """ returns {'test': ..., 'data': ...} for whichever answers are filled in """
+    expected = {}
+    for kind, value in ANSWER_NOTE.findall(text):
+        if not value:
+            continue
+        if kind == 'test answer':
+            expected.setdefault('test', value)
+        else:
+            # later notes win, e.g. "answer (25) = 228668, answer (75) = 270673834779359"
+            expected['data'] = value
+    return expected
+
+
+def expected_answers(day) -> dict:
+    """ maps each part number to its expected answers, e.g. {1: {'test': '41', 'data': '5239'}} """
+    source = day.solution.read_text(encoding='utf-8')
+    source_lines = source.splitlines()
+    answers = {part: {} for part in PARTS}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef) and node.name in ('part_1', 'part_2'):
+            answers[int(node.name[-1])] = parse_notes(notes_for(node, source_lines))
+    return answers
@@ -0,0 +1,242 @@
+"""Benchmarks parse() and part_1/part_2 of any day without changing its solution.py.
+
+Each (day, part) runs in its own fresh worker process so the peak RSS
+belongs to that part alone. The part is called a few times to warm up,
+then timed over the requested number of repeats. Every call gets freshly
+parsed input (some parts change what they're given), unpickled from the
+parse cache after the first, but only the part call itself is timed.
+
+parse() gets a row of its own, timed the same way but never from the
+parse cache, so work done while parsing (2024 Day 1 sorts both lists
+there, Day 12 finds the garden's regions) is still measured, tracked and
+shown in the --sizes growth.
+
+    python -m aoc bench 2024 -d 9 -n 10 -w 2
+
+Results are merged into a JSON file keyed by "year/day/part/input hash",
+where the part is "parse" for the parse() row.
+
+With --sizes the parts are run on generated inputs of each size instead
+(see aoc.generators), and the growth in median time between sizes is
+printed as an exponent, so an O(n^2) part stands out as n^2.0.
+
+    python -m aoc bench 2024 -d 1 9 --sizes 1000 10000 100000
+"""
+
+import hashlib
+import io
+import json
+import logging
+import math
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import replace
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, so peak RSS isn't recorded there
+    resource = None
+
+from aoc import pools
+from aoc.days import find_days, load_solution, part_arguments, read_input
+from aoc.generators import add_size_arguments, make_generated_jobs
+from aoc.runner import add_selection_arguments, make_jobs
+
+DEFAULT_RESULTS_FILE = 'bench_results.json'
+# the part number parse() is benchmarked (and tracked) as
+PARSE = 0
+
+
+def input_hash(input_path) -> str:
+    """ short content hash so results from different inputs never mix """
+    return hashlib.sha256(Path(input_path).read_bytes()).hexdigest()[:16]
+
+
+def part_label(part) -> str:
+    return 'parse' if part == PARSE else f'part {part}'
+
+
+def result_key(job) -> str:
+    part = 'parse' if job.part == PARSE else job.part
+    return f'{job.day.year}/{job.day.number:02d}/{part}/{input_hash(job.input_path)}'
+
+
+def with_parse_jobs(jobs) -> list:
+    """ the jobs with a parse() job in front of the parts of each day and input """
+    all_jobs = []
+    parsed = set()
+    for job in jobs:
+        if (job.day, job.input_path) not in parsed:
+            parsed.add((job.day, job.input_path))
+            all_jobs.append(replace(job, part=PARSE))
+        all_jobs.append(job)
+    return all_jobs
+
+
+def percentile(sorted_times, pct) -> float:
+    """ nearest-rank percentile of an already sorted list """
+    rank = max(1, round(pct / 100 * len(sorted_times)))
+    return sorted_times[rank - 1]
+
+
+def peak_rss_kb():
+    """ peak resident set size of this process in KB (None if unknown) """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KB, macOS reports bytes
+    if peak > 1 << 32:
+        peak //= 1024
+    return peak
+
+
+def time_parse(job, repeats=5, warmup=1) -> tuple:
+    """ returns the type of what parse() gave and the list of timings of an uncached parse """
+    module = load_solution(job.day)
+    raw_lines = read_input(job.input_path)
+    timings = []
+    parsed = None
+    for i in range(warmup + repeats):
+        # drop the last run's result first, so two are never held at once
+        parsed = None
+        with redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            parsed = part_arguments(job.day, module, raw_lines, use_cache=False)
+            elapsed = time.perf_counter() - start_time
+        if i >= warmup:
+            timings.append(elapsed)
+    return ', '.join(type(arg).__name__ for arg in parsed), timings
+
+
+def time_part(job, repeats=5, warmup=1) -> tuple:
+    """ returns the answer and the list of timings for one job """
+    if job.part == PARSE:
+        return time_parse(job, repeats, warmup)
+    module = load_solution(job.day)
+    part_function = getattr(module, f'part_{job.part}')
+    raw_lines = read_input(job.input_path)
+    timings = []
+    answer = None
+    for i in range(warmup + repeats):
+        args = part_arguments(job.day, module, raw_lines)
+        # the solutions' own progress printing isn't wanted here
+        with redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            answer = part_function(*args)
+            elapsed = time.perf_counter() - start_time
+        if i >= warmup:
+            timings.append(elapsed)
+    return answer, timings
+
+
+def bench_job(job, repeats=5, warmup=1) -> dict:
+    """ benchmarks one job and returns its JSON-ready record """
+    record = {
+        'year': job.day.year,
+        'day': job.day.number,
+        'part': job.part,
+        'input': job.input_path.name,
+        'input_hash': input_hash(job.input_path),
+        'repeats': repeats,
+        'warmup': warmup,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    if job.size is not None:
+        record['size'] = job.size
+    try:
+        answer, timings = time_part(job, repeats, warmup)
+    except Exception as e:
+        record['error'] = f'{type(e).__name__}: {e}'
+        return record
+    timings.sort()
+    record['answer'] = str(answer)
+    record['min'] = timings[0]
+    record['median'] = statistics.median(timings)
+    record['p95'] = percentile(timings, 95)
+    record['peak_rss_kb'] = peak_rss_kb()
+    return record
+
+
+def run_benchmarks(jobs, repeats=5, warmup=1, workers=1) -> dict:
+    """ benchmarks the jobs, each in a fresh process, and returns records by key """
+    records = {}
+    if not jobs:
+        return records
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1,
+                             initializer=pools.share_cpus, initargs=(workers,)) as pool:
+        futures = {result_key(job): pool.submit(bench_job, job, repeats, warmup) for job in jobs}
+        for key, future in futures.items():
+            records[key] = future.result()
+            logging.debug(f'{key}: {records[key]}')
+    return records
+
+
+def save_results(records, results_file) -> None:
+    """ merges the new records into the JSON results file """
+    results_file = Path(results_file)
+    all_records = {}
+    if results_file.is_file():
+        all_records = json.loads(results_file.read_text(encoding='utf-8'))
+    all_records.update(records)
+    results_file.write_text(json.dumps(all_records, indent=2, sort_keys=True), encoding='utf-8')
+
+
+def print_records(records) -> None:
+    print(f'{"key":>32} {"min":>9} {"median":>9} {"p95":>9} {"rss KB":>9}  answer')
+    for key, r in records.items():
+        if 'error' in r:
+            print(f'{key:>32}  ERROR {r["error"]}')
+        else:
+            print(f'{key:>32} {r["min"]:9.4f} {r["median"]:9.4f} {r["p95"]:9.4f} '
+                  f'{r["peak_rss_kb"] or "-":>9}  {r["answer"]}')
+
+
+def print_scaling(records) -> None:
+    """ median time against generated input size, with the growth exponent between sizes """
+    curves = {}
+    for r in records.values():
+        if 'size' in r and 'error' not in r:
+            curves.setdefault((r['year'], r['day'], r['part']), []).append((r['size'], r['median']))
+    for (year, day, part), points in sorted(curves.items()):
+        print(f'\n{year} Day {day} {part_label(part)}')
+        print(f'{"size":>12} {"median":>10}  growth')
+        previous = None
+        for size, median in sorted(points):
+            growth = ''
+            if previous and size > previous[0] and median > 0 and previous[1] > 0:
+                # t ~ n^k, so k = log(t2/t1) / log(n2/n1)
+                exponent = math.log(median / previous[1]) / math.log(size / previous[0])
+                growth = f'n^{exponent:.2f}'
+            print(f'{size:>12} {median:10.4f}  {growth}')
+            previous = (size, median)
+
+
+def add_parser(subparsers):
+    parser = subparsers.add_parser('bench', help='benchmark the solutions')
+    add_selection_arguments(parser)
+    parser.add_argument('-n', '--repeats', type=int, default=5, help='timed runs per part')
+    parser.add_argument('-w', '--warmup', type=int, default=1, help='untimed runs before timing')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='parts benchmarked at once (more than 1 skews the timings)')
+    parser.add_argument('-o', '--output', default=DEFAULT_RESULTS_FILE, help='JSON results file')
+    add_size_arguments(parser)
+    parser.set_defaults(func=main)
+
+
+def main(args) -> int:
+    days = find_days(args.years, args.days)
+    if args.sizes:
+        jobs = make_generated_jobs(days, args.parts, args.sizes, args.seed)
+    else:
+        jobs = make_jobs(days, args.parts, args.test)
+    records = run_benchmarks(with_parse_jobs(jobs), args.repeats, args.warmup, args.jobs)
+    print_records(records)
+    if args.sizes:
+        print_scaling(records)
+    save_results(records, args.output)
+    print(f'results saved to {args.output}')
+    return 1 if any('error' in r for r in records.values()) else 0
@@ -0,0 +1,111 @@
+"""Finds the daily solutions and loads them without running their __main__ block.
+
+Every day lives in AdventOfCode/<year>/Day N/solution.py and defines part_1
+and part_2. By default both parts are handed the stripped input lines. Days
+whose parts need something else define parse(input_lines), which gets the
+raw lines and returns the value (or tuple of positional values) given to
+both parts. What parse() returns is cached (see aoc.parse_cache), so it
+only runs once per input.
+"""
+
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.loader import open_input
+from aoc.parse_cache import cached_parse
+
+AOC_ROOT = Path(__file__).resolve().parent.parent
+DAY_FOLDER = re.compile(r'^Day (\d+)$')
+PARTS = (1, 2)
+
+
+@dataclass(frozen=True)
+class Day:
+    """ a single puzzle day and the files that go with it """
+    year: int
+    number: int
+    folder: Path
+
+    @property
+    def solution(self) -> Path:
+        return self.folder / 'solution.py'
+
+    @property
+    def key(self) -> str:
+        return f'{self.year}-{self.number:02d}'
+
+    def input_file(self, use_test=False) -> Path:
+        if use_test:
+            return self.folder / 'input_test.txt'
+        return self.folder / 'input.txt'
+
+    def __str__(self) -> str:
+        return f'{self.year} Day {self.number}'
+
+
+def find_days(years=None, numbers=None) -> list:
+    """ returns every Day with a solution.py, optionally limited to the given years/day numbers """
+    days = []
+    for year_folder in AOC_ROOT.iterdir():
+        if not (year_folder.is_dir() and year_folder.name.isdigit()):
+            continue
+        year = int(year_folder.name)
+        if years and year not in years:
+            continue
+        for day_folder in year_folder.iterdir():
+            # skips the "Day 0 - Framework" templates
+            match = DAY_FOLDER.match(day_folder.name)
+            if not match or not (day_folder / 'solution.py').is_file():
+                continue
+            number = int(match.group(1))
+            if numbers and number not in numbers:
+                continue
+            days.append(Day(year, number, day_folder))
+    days.sort(key=lambda d: (d.year, d.number))
+    return days
+
+
+def load_solution(day):
+    """ imports the day's solution.py as a module, __main__ is not run """
+    module_name = f'aoc_{day.year}_day{day.number:02d}'
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, day.solution)
+    module = importlib.util.module_from_spec(spec)
+    # some days split their code into local modules (2024 Day 16 has solver.py and node.py)
+    folder = str(day.folder)
+    sys.path.insert(0, folder)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(folder)
+    sys.modules[module_name] = module
+    return module
+
+
+def read_input(input_path):
+    """ memory-maps the input and returns its raw lines (newlines included) """
+    return open_input(input_path)
+
+
+def part_arguments(day, module, raw_lines, use_cache=True) -> tuple:
+    """ builds the positional arguments that part_1/part_2 are called with """
+    if hasattr(module, 'parse'):
+        if use_cache:
+            parsed = cached_parse(day, module, raw_lines)
+        else:
+            parsed = module.parse(raw_lines)
+        if isinstance(parsed, tuple):
+            return parsed
+        return (parsed,)
+    return (raw_lines.stripped(),)
+
+
+def solve(day, part, input_path, use_cache=True):
+    """ loads the day, reads the input and returns the answer for one part """
+    module = load_solution(day)
+    args = part_arguments(day, module, read_input(input_path), use_cache)
+    return getattr(module, f'part_{part}')(*args)
@@ -0,0 +1,112 @@
+"""A first-fit allocator over extents of free space.
+
+    allocator = FirstFitAllocator([(2, 3), (8, 3), (12, 1)], max_size=9)
+    allocator.allocate(2)               # 2, the leftmost free span that fits
+    allocator.allocate(3, before=8)     # -1, nothing fits to the left of 8
+    allocator.release(2, 2)             # freed again, merged with its neighbors
+    allocator.stats()                   # free blocks, spans, fragmentation ...
+
+Free spans are kept by start (and by end, to merge a released extent with
+its neighbors), plus one min-heap of span starts for each span length up
+to max_size. The leftmost span that fits a request of n is the smallest
+start among the tops of the heaps for lengths n to max_size, so an
+allocation is O(max_size * log spans) rather than a scan from the start
+of the disk. Spans longer than max_size share the last heap, a request
+for more than max_size has to look through all of that one.
+
+Heap entries aren't removed when their span is used or merged, they're
+dropped when they come to the top and no longer start a free span of
+that heap's length.
+"""
+
+import heapq
+
+
+class FirstFitAllocator:
+    """ hands out the leftmost free span that fits, splitting it if it's bigger """
+
+    def __init__(self, spans=(), max_size=9):
+        self.max_size = max_size
+        self._by_start = {}
+        self._by_end = {}
+        # _heaps[n] holds the starts of the spans of length n (or more, for max_size)
+        self._heaps = [[] for _ in range(max_size + 1)]
+        self.allocations = 0
+        self.failures = 0
+        for start, length in spans:
+            if length > 0:
+                # spans that touch are one span
+                self.release(start, length)
+
+    def _add(self, start, length):
+        self._by_start[start] = length
+        self._by_end[start + length] = start
+        heapq.heappush(self._heaps[min(length, self.max_size)], start)
+
+    def _remove(self, start):
+        length = self._by_start.pop(start)
+        del self._by_end[start + length]
+        return length
+
+    def find(self, size, before=None) -> int:
+        """ the start of the leftmost free span of at least size, or -1 """
+        by_start = self._by_start
+        max_size = self.max_size
+        # nothing at or past the limit will do
+        limit = best = before if before is not None else float('inf')
+        for n in range(min(size, max_size), max_size + 1):
+            heap = self._heaps[n]
+            # drop the starts of spans that have since been used or merged
+            while heap:
+                length = by_start.get(heap[0], 0)
+                if length == n or (n == max_size and length > n):
+                    break
+                heapq.heappop(heap)
+            if not heap or heap[0] >= best:
+                continue
+            if by_start[heap[0]] >= size:
+                best = heap[0]
+            else:
+                # only in the oversized heap, so look through all of it
+                best = min((start for start in heap if start < best and by_start.get(start, 0) >= size),
+                           default=best)
+        return best if best < limit else -1
+
+    def allocate(self, size, before=None) -> int:
+        """ takes size blocks from the leftmost span that fits (starting before before), or -1 """
+        start = self.find(size, before)
+        if start < 0:
+            self.failures += 1
+            return -1
+        length = self._remove(start)
+        if length > size:
+            self._add(start + size, length - size)
+        self.allocations += 1
+        return start
+
+    def release(self, start, length):
+        """ frees an extent, merging it with any free span either side """
+        if start in self._by_end:
+            before_start = self._by_end[start]
+            length += self._remove(before_start)
+            start = before_start
+        if start + length in self._by_start:
+            length += self._remove(start + length)
+        self._add(start, length)
+
+    def spans(self) -> list:
+        """ (start, length) of every free span, in disk order """
+        return sorted(self._by_start.items())
+
+    def stats(self) -> dict:
+        free = sum(self._by_start.values())
+        largest = max(self._by_start.values(), default=0)
+        return {
+            'free_blocks': free,
+            'free_spans': len(self._by_start),
+            'largest_span': largest,
+            # 0 when all the free space is one span, towards 1 as it's split up
+            'fragmentation': 1 - largest / free if free else 0.0,
+            'allocations': self.allocations,
+            'failures': self.failures,
+        }
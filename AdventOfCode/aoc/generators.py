@@ -0,0 +1,111 @@
+"""Builds large, seeded puzzle inputs to see how the solutions scale.
+
+A day can have a generate.py next to its solution.py, defining
+
+    def generate(size, rng):
+        yield line
+        ...
+
+which yields the lines of a valid puzzle input. What size means is up to
+the day (location pairs for 2024 Day 1, the side of the garden for 2024
+Day 12) and rng is a random.Random seeded from --seed, so a size and seed
+always give the same input. Each input is written once to
+.cache/generated/, named by its size, seed and a hash of generate.py, and
+reused until the generator changes.
+
+    python -m aoc generate 2024 -d 1 --sizes 1000 100000      # just write the inputs
+    python -m aoc bench 2024 -d 9 --sizes 1000 10000 100000   # time vs size
+"""
+
+import hashlib
+import importlib.util
+import os
+import random
+import tempfile
+from itertools import islice
+from pathlib import Path
+
+from aoc.days import AOC_ROOT, PARTS, find_days
+from aoc.runner import Job, add_selection_arguments
+
+GENERATED_DIR = AOC_ROOT / '.cache' / 'generated'
+DEFAULT_SEED = 2024
+LINES_PER_WRITE = 10000
+
+
+def load_generator(day):
+    """ the day's generate.py as a module, or None if it doesn't have one """
+    path = day.folder / 'generate.py'
+    if not path.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location(f'aoc_{day.year}_day{day.number:02d}_generate', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_lines(path, lines) -> None:
+    """ writes the lines a batch at a time to a temp file, then renames it into place """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+            while batch := list(islice(lines, LINES_PER_WRITE)):
+                f.write('\n'.join(batch))
+                f.write('\n')
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def generator_hash(day) -> str:
+    """ a short hash of the day's generate.py, so an edited generator writes new inputs """
+    return hashlib.sha256((day.folder / 'generate.py').read_bytes()).hexdigest()[:12]
+
+
+def generated_input(day, size, seed=DEFAULT_SEED, generator=None) -> Path:
+    """ the path of the day's generated input for this size and seed, written if needed """
+    path = GENERATED_DIR / f'{day.key}-{size}-{seed}-{generator_hash(day)}.txt'
+    if not path.is_file():
+        generator = generator or load_generator(day)
+        write_lines(path, iter(generator.generate(size, random.Random(seed))))
+    return path
+
+
+def make_generated_jobs(days, parts=PARTS, sizes=(), seed=DEFAULT_SEED) -> list:
+    """ a job for each part of each day with a generator, at every size """
+    jobs = []
+    for day in days:
+        generator = load_generator(day)
+        if generator is None:
+            continue
+        for size in sizes:
+            input_path = generated_input(day, size, seed, generator)
+            for part in parts:
+                jobs.append(Job(day, part, input_path, size=size))
+    return jobs
+
+
+def add_parser(subparsers):
+    parser = subparsers.add_parser('generate', help='write large generated inputs')
+    add_selection_arguments(parser)
+    add_size_arguments(parser, required=True)
+    parser.set_defaults(func=main)
+
+
+def add_size_arguments(parser, required=False):
+    parser.add_argument('--sizes', nargs='+', type=int, required=required,
+                        help="generated input sizes (what a size means depends on the day)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='seed for the generated inputs')
+
+
+def main(args) -> int:
+    for day in find_days(args.years, args.days):
+        generator = load_generator(day)
+        if generator is None:
+            continue
+        for size in args.sizes:
+            path = generated_input(day, size, args.seed, generator)
+            print(f'{str(day):>12} {size:>10}  {path.stat().st_size / 1e6:9.2f} MB  {path}')
+    return 0
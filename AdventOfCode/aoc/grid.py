@@ -0,0 +1,195 @@
+"""A compact 2D grid of single byte cells.
+
+The cells are stored row-major in one flat bytearray, so a 140x140 puzzle
+map is about 20KB instead of ~20,000 Python objects. A cell is addressed
+either by (row, col) or by its flat index, and the neighbor offset tables
+let the hot loops step around the grid with plain integer adds.
+
+A padded grid has a border of filler cells around the puzzle, so a
+neighbor of any real cell is always a valid index and the hot loops can
+skip the bounds checks. Rows and columns are still given in puzzle
+coordinates, the padding is hidden by index() and coords().
+
+Cells hold byte values, so compare them against ord('#') or b'#'[0] rather
+than against str characters.
+
+numpy is optional and lazily imported: find_all() only uses it on grids
+of NUMPY_MIN_BYTES or more, and as_array() needs it.
+"""
+
+from aoc.lazy import optional_import
+from aoc.loader import NUMPY_MIN_BYTES, Lines
+
+np = optional_import('numpy')
+
+# row/column steps for the 4 and 8 neighbors, clockwise from North
+DIRS4 = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIRS8 = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+def as_byte(value) -> int:
+    """ accepts a cell value as an int, a 1 character str or a 1 byte bytes """
+    if isinstance(value, int):
+        return value
+    return ord(value)
+
+
+class Grid:
+    """ a width x height grid of bytes, optionally padded with a border of filler cells """
+
+    def __init__(self, width, height, fill='.', pad=None):
+        self.width = width
+        self.height = height
+        self.border = 0 if pad is None else 1
+        self.stride = width + 2 * self.border
+        self._origin = self.border * self.stride + self.border
+        filler = as_byte(fill if pad is None else pad)
+        self.cells = bytearray([filler]) * (self.stride * (height + 2 * self.border))
+        if pad is not None:
+            blank_row = bytes([as_byte(fill)]) * width
+            for r in range(height):
+                self.set_row(r, blank_row)
+        # flat index steps to each neighbor, in the same order as DIRS4/DIRS8
+        self.offsets4 = tuple(dr * self.stride + dc for dr, dc in DIRS4)
+        self.offsets8 = tuple(dr * self.stride + dc for dr, dc in DIRS8)
+
+    @classmethod
+    def from_lines(cls, input_lines, pad=None):
+        """ builds a grid from the puzzle lines (str or bytes), ignoring trailing newlines """
+        if isinstance(input_lines, Lines):
+            # a memory-mapped input, so skip decoding it line by line
+            return cls.from_bytes(input_lines.data, pad)
+        rows = []
+        for line in input_lines:
+            if isinstance(line, str):
+                line = line.encode()
+            line = line.rstrip(b'\r\n')
+            if line:
+                rows.append(line)
+        width = len(rows[0]) if rows else 0
+        grid = cls(width, len(rows), pad=pad)
+        for r, row in enumerate(rows):
+            grid.set_row(r, row)
+        return grid
+
+    @classmethod
+    def from_bytes(cls, data, pad=None):
+        """ builds a grid straight from the raw input bytes (newline separated rows) """
+        data = bytes(data).replace(b'\r\n', b'\n').strip(b'\n')
+        width = data.find(b'\n')
+        if width < 0:
+            width = len(data)
+        cells = data.replace(b'\n', b'')
+        height = len(cells) // width if width else 0
+        if width * height != len(cells):
+            raise ValueError('the grid rows are not all the same length')
+        grid = cls(width, height, pad=pad)
+        if pad is None:
+            grid.cells[:] = cells
+        else:
+            for r in range(height):
+                grid.set_row(r, cells[r * width:(r + 1) * width])
+        return grid
+
+    @property
+    def padded(self) -> bool:
+        return self.border > 0
+
+    @property
+    def size(self) -> int:
+        """ number of real (not padding) cells """
+        return self.width * self.height
+
+    def index(self, r, c) -> int:
+        return self._origin + r * self.stride + c
+
+    def coords(self, i):
+        r, c = divmod(i - self._origin, self.stride)
+        return r, c
+
+    def in_bounds(self, r, c) -> bool:
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    def __getitem__(self, coord) -> int:
+        r, c = coord
+        return self.cells[self._origin + r * self.stride + c]
+
+    def __setitem__(self, coord, value):
+        r, c = coord
+        self.cells[self._origin + r * self.stride + c] = as_byte(value)
+
+    def get(self, r, c, default=None):
+        """ bounds-checked read, returns default for anything off the grid """
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return self.cells[self._origin + r * self.stride + c]
+        return default
+
+    def row(self, r) -> bytes:
+        start = self.index(r, 0)
+        return bytes(self.cells[start:start + self.width])
+
+    def set_row(self, r, values):
+        start = self.index(r, 0)
+        self.cells[start:start + self.width] = values
+
+    def rows(self):
+        for r in range(self.height):
+            yield self.row(r)
+
+    def neighbors4(self, i):
+        """ flat indexes of the N, E, S, W neighbors that are on the grid """
+        if self.border:
+            return [i + step for step in self.offsets4]
+        r, c = self.coords(i)
+        return [i + step for step, (dr, dc) in zip(self.offsets4, DIRS4)
+                if 0 <= r + dr < self.height and 0 <= c + dc < self.width]
+
+    def neighbors8(self, i):
+        """ flat indexes of the 8 surrounding neighbors that are on the grid """
+        if self.border:
+            return [i + step for step in self.offsets8]
+        r, c = self.coords(i)
+        return [i + step for step, (dr, dc) in zip(self.offsets8, DIRS8)
+                if 0 <= r + dr < self.height and 0 <= c + dc < self.width]
+
+    def find(self, value) -> int:
+        """ flat index of the first cell holding the value, or -1 (padding included) """
+        return self.cells.find(as_byte(value))
+
+    def find_all(self, value) -> list:
+        """ flat indexes of every cell holding the value (padding included) """
+        target = as_byte(value)
+        if np is not None and len(self.cells) >= NUMPY_MIN_BYTES:
+            return np.flatnonzero(self.as_array() == target).tolist()
+        found = []
+        i = self.cells.find(target)
+        while i >= 0:
+            found.append(i)
+            i = self.cells.find(target, i + 1)
+        return found
+
+    def count(self, value) -> int:
+        """ how many cells hold the value (padding is never counted) """
+        target = as_byte(value)
+        if self.border:
+            return sum(row.count(target) for row in self.rows())
+        return self.cells.count(target)
+
+    def as_array(self):
+        """ a zero-copy (height, stride) numpy uint8 view of the cells, padding included """
+        if np is None:
+            raise ImportError('numpy is needed for Grid.as_array()')
+        rows = self.height + 2 * self.border
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(rows, self.stride)
+
+    def copy(self):
+        the_copy = Grid.__new__(Grid)
+        the_copy.__dict__.update(self.__dict__)
+        the_copy.cells = bytearray(self.cells)
+        return the_copy
+
+    def dump(self) -> str:
+        return '\n'.join(row.decode() for row in self.rows())
+
+    def __str__(self) -> str:
+        return self.dump()
@@ -0,0 +1,90 @@
+"""Checks how long each day takes to import, against a budget.
+
+    python -m aoc importtime                  # every day, default budget
+    python -m aoc importtime 2024 -d 8 16 --budget 20
+
+Each day's solution.py is loaded in a fresh interpreter run with
+-X importtime, after the aoc harness itself has been imported, so only
+the modules the day pulls in are counted. Days over the budget are
+listed with their most expensive imports and the command fails, which
+catches an unused scipy import before the runner pays for it in every
+worker process.
+"""
+
+import logging
+import re
+import subprocess
+import sys
+
+from aoc.days import AOC_ROOT, find_days
+from aoc.runner import add_selection_arguments
+
+DEFAULT_BUDGET_MS = 50.0
+WORST_IMPORTS = 5
+MARKER = '-- aoc: loading the solution --'
+
+# "import time:  self [us] | cumulative | <indent>package", indented 2 per nesting level
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+PROBE = '''
+import sys
+from pathlib import Path
+from aoc.days import Day, load_solution
+day = Day({year}, {number}, Path({folder!r}))
+print({marker!r}, file=sys.stderr, flush=True)
+load_solution(day)
+'''
+
+
+def top_level_imports(importtime_output) -> list:
+    """ (package, cumulative ms) for each top-level import after the marker """
+    _, _, after_marker = importtime_output.partition(MARKER)
+    imports = []
+    for line in after_marker.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match and not match.group(3):
+            imports.append((match.group(4), int(match.group(2)) / 1000))
+    return imports
+
+
+def measure_day(day) -> list:
+    """ the top-level imports (and their cost) made by loading the day's solution """
+    probe = PROBE.format(year=day.year, number=day.number, folder=str(day.folder), marker=MARKER)
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe],
+                               cwd=AOC_ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        last_line = completed.stderr.strip().splitlines()[-1:]
+        raise RuntimeError(last_line[0] if last_line else f'exit status {completed.returncode}')
+    return top_level_imports(completed.stderr)
+
+
+def add_parser(subparsers):
+    parser = subparsers.add_parser('importtime', help='check each day against an import time budget')
+    add_selection_arguments(parser)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'import time allowed per day, in ms (default: {DEFAULT_BUDGET_MS:g})')
+    parser.set_defaults(func=main)
+
+
+def main(args) -> int:
+    over_budget = 0
+    print(f'{"day":>12} {"ms":>9}  most expensive imports')
+    for day in find_days(args.years, args.days):
+        try:
+            imports = measure_day(day)
+        except RuntimeError as e:
+            logging.error(f'{day}: could not be loaded, {e}')
+            over_budget += 1
+            continue
+        total_ms = sum(ms for _, ms in imports)
+        worst = sorted(imports, key=lambda item: item[1], reverse=True)[:WORST_IMPORTS]
+        worst_text = ', '.join(f'{name} {ms:.1f}' for name, ms in worst)
+        flag = ''
+        if total_ms > args.budget:
+            over_budget += 1
+            flag = '  OVER BUDGET'
+        print(f'{str(day):>12} {total_ms:9.1f}  {worst_text}{flag}')
+    if over_budget:
+        print(f'{over_budget} days over the {args.budget:g} ms budget (or failing to load)')
+        return 1
+    return 0
@@ -0,0 +1,51 @@
+"""Imports modules on first use, so a day only pays for what it actually touches.
+
+    np = optional_import('numpy')       # None when numpy isn't installed
+    nx = lazy_import('networkx')        # ModuleNotFoundError when it isn't
+
+Both return straight away with a module whose code hasn't run yet; it's
+loaded the first time one of its attributes is used. numpy, scipy or
+networkx can cost hundreds of ms to import, which the runner would pay in
+every worker whether or not the part ever calls them.
+
+Only top-level packages are deferred: finding "scipy.spatial" has to
+import scipy first, so use lazy_import('scipy') and scipy.spatial from
+there instead. Annotations are evaluated when a function is defined, so
+write them as strings ('nx.Graph') to keep them from loading the module.
+
+Setting AOC_WITHOUT=numpy (a comma separated list) makes optional_import()
+act as if those modules weren't installed, so the stdlib fallbacks can be
+checked against the optional paths on the same machine:
+
+    python -m aoc run 2024 --no-cache
+    AOC_WITHOUT=numpy python -m aoc run 2024 --no-cache
+"""
+
+import importlib.util
+import os
+import sys
+
+
+def lazy_import(name):
+    """ the named module, which is only actually imported on first attribute access """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def optional_import(name):
+    """ like lazy_import(), but None when the module isn't installed (or is in AOC_WITHOUT) """
+    if name in os.environ.get('AOC_WITHOUT', '').split(','):
+        return None
+    try:
+        return lazy_import(name)
+    except ModuleNotFoundError:
+        return None
@@ -0,0 +1,104 @@
+"""Memory-maps the puzzle input instead of reading it into a list of strings.
+
+f.readlines() followed by [x.strip() for x in lines] holds two full copies
+of the input as Python strings before any solving starts. open_input()
+maps the file and returns Lines, a read-only sequence over the mapped
+bytes that only decodes a line when it's asked for, so the input is never
+copied as a whole. Lines can be iterated, indexed, sliced (slices are
+plain lists), searched with index() and len()'d, which is everything the
+solutions do with their input_lines.
+
+Grid shaped inputs can skip the lines entirely: Lines.data is a memoryview
+of the whole file, Grid.from_lines() builds straight from it, and
+Lines.as_array() is a zero-copy (rows, width) numpy view when numpy is
+installed. numpy is imported lazily and only used to find the line ends
+of inputs of NUMPY_MIN_BYTES or more, so a normal sized input never pays
+for importing it.
+"""
+
+import mmap
+import re
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+
+from aoc.lazy import optional_import
+
+np = optional_import('numpy')
+
+NEWLINE = ord('\n')
+# below this, re.finditer() finds the newlines faster than numpy can be imported
+NUMPY_MIN_BYTES = 1 << 20
+
+
+def line_offsets(data) -> array:
+    """ the start of each line in the data, plus the end of the data """
+    offsets = array('q', [0])
+    if np is not None and len(data) >= NUMPY_MIN_BYTES:
+        ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == NEWLINE) + 1
+        offsets.frombytes(ends.astype(np.int64).tobytes())
+    else:
+        offsets.extend(match.end() for match in re.finditer(b'\n', data))
+    if offsets[-1] != len(data):
+        # the last line doesn't end with a newline
+        offsets.append(len(data))
+    return offsets
+
+
+class Lines(Sequence):
+    """ lazily decoded lines of a memory-mapped input file """
+
+    def __init__(self, data, offsets, strip=False):
+        self.data = data
+        self._offsets = offsets
+        self._strip = strip
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _line(self, i) -> str:
+        line = str(self.data[self._offsets[i]:self._offsets[i + 1]], 'utf-8')
+        if self._strip:
+            return line.strip()
+        return line
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._line(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('line index out of range')
+        return self._line(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._line(i)
+
+    def stripped(self):
+        """ the same lines with whitespace stripped, like [x.strip() for x in lines] """
+        return Lines(self.data, self._offsets, strip=True)
+
+    def copy(self) -> list:
+        return list(self)
+
+    def as_array(self):
+        """ a zero-copy (rows, width) numpy uint8 view of a grid shaped input """
+        if np is None:
+            raise ImportError('numpy is needed for Lines.as_array()')
+        width = self._offsets[1] - 1 if len(self) else 0
+        cells = np.frombuffer(self.data, dtype=np.uint8)
+        return np.lib.stride_tricks.as_strided(cells, shape=(len(self), width),
+                                               strides=(width + 1, 1), writeable=False)
+
+
+def open_input(input_path) -> Lines:
+    """ maps the input file and returns its raw lines (newlines included, like readlines()) """
+    with Path(input_path).open('rb') as f:
+        try:
+            data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:
+            # an empty file can't be mapped
+            data = memoryview(b'')
+    # the map stays open after the file is closed, for as long as the lines are in use
+    return Lines(data, line_offsets(data))
@@ -0,0 +1,123 @@
+"""Counters, gauges and timers for the solutions' hot loops.
+
+    from aoc import metrics
+
+    metrics.count('day6.candidates')           # add 1
+    metrics.count('day6.temp_steps', steps)    # add steps
+    metrics.gauge('day6.blockers', len(blockers))
+    with metrics.span('day9.defrag'):
+        ...
+
+Metrics are off by default, and then every call is one global check and
+a return (span() hands back a shared do-nothing context manager), so
+they can stay in the solutions instead of progress prints. In a really
+tight loop, add up locally and count() once per outer iteration.
+
+python -m aoc run --metrics turns them on around each part, and the
+values collected come back with the answer for a per-run summary.
+
+A part that farms work out to its own process pool gets nothing back
+from the workers by itself. Each task should reset() first (a forked
+worker starts with a copy of the parent's metrics), return snapshot()
+with its result, and the part merge()s them:
+
+    def task(chunk):
+        metrics.reset()
+        return work(chunk), metrics.snapshot()
+"""
+
+import time
+
+enabled = False
+
+_counters = {}
+_gauges = {}
+# timer name -> [calls, total seconds]
+_timers = {}
+
+
+def enable(on=True) -> None:
+    global enabled
+    enabled = on
+
+
+def reset() -> None:
+    _counters.clear()
+    _gauges.clear()
+    _timers.clear()
+
+
+def count(name, n=1) -> None:
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def gauge(name, value) -> None:
+    """ records the latest value of something, like a queue length """
+    if enabled:
+        _gauges[name] = value
+
+
+class _Span:
+    """ times the code inside a with block """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        timer = _timers.setdefault(self.name, [0, 0.0])
+        timer[0] += 1
+        timer[1] += time.perf_counter() - self.start_time
+        return False
+
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name):
+    if enabled:
+        return _Span(name)
+    return _NO_SPAN
+
+
+def snapshot() -> dict:
+    """ everything collected since the last reset(), ready for JSON """
+    return {
+        'counters': dict(_counters),
+        'gauges': dict(_gauges),
+        'timers': {name: {'calls': calls, 'secs': secs} for name, (calls, secs) in _timers.items()},
+    }
+
+
+def merge(collected) -> None:
+    """ adds a snapshot() from another process into this one's metrics """
+    if not enabled:
+        return
+    for name, n in collected['counters'].items():
+        _counters[name] = _counters.get(name, 0) + n
+    _gauges.update(collected['gauges'])
+    for name, timer in collected['timers'].items():
+        totals = _timers.setdefault(name, [0, 0.0])
+        totals[0] += timer['calls']
+        totals[1] += timer['secs']
+
+
+def summary(collected) -> list:
+    """ one line of text per metric in a snapshot() """
+    lines = [f'{name} = {value}' for name, value in sorted(collected['counters'].items())]
+    lines += [f'{name} = {value} (gauge)' for name, value in sorted(collected['gauges'].items())]
+    lines += [f'{name}: {timer["calls"]} calls, {timer["secs"]:.3f} secs'
+              for name, timer in sorted(collected['timers'].items())]
+    return lines
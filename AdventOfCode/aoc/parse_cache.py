@@ -0,0 +1,95 @@
+"""Caches what a day's parse() returns, in memory and on disk.
+
+parse() runs once per input. Its result is pickled to
+.cache/parsed/<year>-<day>-<hash>.pickle, where the hash covers the input
+bytes and the source of solution.py and every local module it imports (the
+same source hash as the result cache), so a different input, an edited
+solution or a change to a class it pickles, like aoc.grid's Grid, never
+picks up a stale result. The other part, the bench repeats and the next
+run all unpickle it instead of parsing again.
+
+Every caller gets its own unpickled copy, so a part is still free to
+change what it's given (2024 Day 9 defrags its Disk in place). Results
+that can't be pickled, like the memory-mapped input lines themselves,
+just aren't cached, and neither are ones bigger than the whole cache.
+
+Like the result cache, a hit touches the entry's mtime and the least
+recently used entries are deleted once the cache grows past
+MAX_CACHE_BYTES. Nothing is kept in memory between calls, so a large
+input is only ever held as the object a part is working on. A day can
+leave scratch space out of its pickle with __getstate__ (2024 Day 6's
+GuardMap leaves out its seen table).
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+PARSE_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'parsed'
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(day, raw_lines) -> str:
+    # imported here, the result cache imports this module
+    from aoc.result_cache import source_hash
+    digest = hashlib.sha256(source_hash(day).encode())
+    digest.update(raw_lines.data)
+    return f'{day.key}-{digest.hexdigest()[:16]}'
+
+
+def write_atomically(path, data) -> None:
+    """ writes to a temp file then renames it, so a reader never sees half a file """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_cached(key):
+    """ the pickled result for the key, or None when it isn't cached """
+    path = PARSE_CACHE_DIR / f'{key}.pickle'
+    try:
+        pickled = path.read_bytes()
+        # mark it as recently used
+        os.utime(path)
+    except FileNotFoundError:
+        # not cached, or another worker evicted it first
+        return None
+    return pickled
+
+
+def cached_parse(day, module, raw_lines):
+    """ calls module.parse(raw_lines), or unpickles what it returned last time """
+    key = cache_key(day, raw_lines)
+    pickled = load_cached(key)
+    if pickled is not None:
+        try:
+            return pickle.loads(pickled)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logging.debug(f'{day}: ignoring unreadable parse cache {key}, {e}')
+
+    parsed = module.parse(raw_lines)
+    try:
+        pickled = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+        logging.debug(f'{day}: parse() result is not cached, {e}')
+        return parsed
+    if len(pickled) > MAX_CACHE_BYTES:
+        logging.debug(f'{day}: a {len(pickled)} byte parse() result is too big to cache')
+        return parsed
+    # imported here, the result cache imports this module
+    from aoc.result_cache import evict
+    try:
+        write_atomically(PARSE_CACHE_DIR / f'{key}.pickle', pickled)
+        evict(MAX_CACHE_BYTES, PARSE_CACHE_DIR, '*.pickle')
+    except OSError as e:
+        logging.warning(f'{day}: could not write the parse cache, {e}')
+    return parsed
@@ -0,0 +1,32 @@
+"""How many worker processes a day's own process pool should start.
+
+A few days (2024 Days 5, 6 and 7) spread their work across a process pool
+once the input is big enough. On its own that pool can use every CPU, but
+the runner is already running one part per CPU, so a pool in each of its
+workers would start cpu_count() processes per worker. The runner calls
+share_cpus() in each of its workers, which leaves that worker's fair share
+of the CPUs in AOC_POOL_WORKERS for pool_workers() to find.
+
+The day pools get the solution module by forking (it isn't importable by
+name), so without fork they don't start at all.
+"""
+
+import multiprocessing
+import os
+
+POOL_WORKERS_ENV = 'AOC_POOL_WORKERS'
+
+
+def share_cpus(runner_workers) -> None:
+    """ limits the pools started in this process to its share of the CPUs """
+    os.environ[POOL_WORKERS_ENV] = str(max(1, (os.cpu_count() or 1) // runner_workers))
+
+
+def pool_workers() -> int:
+    """ how many processes a day's pool should use, 1 meaning no pool """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return 1
+    shared = os.environ.get(POOL_WORKERS_ENV)
+    if shared:
+        return max(1, int(shared))
+    return os.cpu_count() or 1
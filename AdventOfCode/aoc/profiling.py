@@ -0,0 +1,120 @@
+"""Profiles part_1/part_2 calls to show where the time goes.
+
+    python -m aoc run 2024 -d 6 9 --profile
+    python -m aoc run 2024 -d 6 --profile reports/day6 --profile-top 40
+
+For every part run, three reports are written to the reports directory:
+
+    2024-06-part2.txt     the top functions by self time (cProfile)
+    2024-06-part2.pstats  the full cProfile stats, for snakeviz or pstats
+    2024-06-part2.folded  collapsed stacks for flamegraph.pl or speedscope
+
+The collapsed stacks come from a sampling profiler. A CPU-time interval
+timer interrupts the part every SAMPLE_INTERVAL seconds and the signal
+handler records the stack it interrupted, so every sample is a real
+call stack, not one rebuilt from cProfile's caller/callee pairs. The
+timer needs signal.setitimer, so there are no .folded files on Windows.
+Only the part call is profiled, parse() runs before the profilers start.
+"""
+
+import cProfile
+import io
+import pstats
+import signal
+from collections import Counter
+from pathlib import Path
+
+from aoc.days import load_solution, part_arguments, read_input
+
+DEFAULT_REPORTS_DIR = 'reports'
+TOP_FUNCTIONS = 25
+SAMPLE_INTERVAL = 0.001
+
+
+def frame_label(code) -> str:
+    """ how a function shows up in the stacks, e.g. Position.goingMyWay (solution.py:42) """
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f'{name} ({Path(code.co_filename).name}:{code.co_firstlineno})'
+
+
+class StackSampler:
+    """ counts the call stacks seen by a CPU-time interval timer """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = {}
+        self._root = None
+
+    @staticmethod
+    def available() -> bool:
+        return hasattr(signal, 'setitimer')
+
+    def _sample(self, signum, frame):
+        # this runs under cProfile too, so it makes no calls that would
+        # show up in the self time table, the stack is kept innermost first
+        stack = ()
+        while frame is not None and frame.f_code is not self._root:
+            stack += (frame.f_code,)
+            frame = frame.f_back
+        if stack:
+            try:
+                self.stacks[stack] += 1
+            except KeyError:
+                self.stacks[stack] = 1
+
+    def runcall(self, function, *args):
+        """ calls function(*args), sampling only the frames below this call """
+        self._root = StackSampler.runcall.__code__
+        previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return function(*args)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous_handler)
+
+    def collapsed(self) -> str:
+        """ one "outer;inner;innermost count" line per distinct stack """
+        folded = Counter()
+        for stack, count in self.stacks.items():
+            folded[';'.join(frame_label(code) for code in reversed(stack))] += count
+        return ''.join(f'{stack} {count}\n' for stack, count in folded.most_common())
+
+
+def self_time_table(profiler, top=TOP_FUNCTIONS) -> str:
+    """ the top functions by self time, as pstats prints them """
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    # the sampler's signal handler is profiling overhead, not the solution
+    handler = StackSampler._sample.__code__
+    for key in [k for k in stats.stats if k[0] == handler.co_filename and k[2] == handler.co_name]:
+        del stats.stats[key]
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return report.getvalue()
+
+
+def profile_part(job, reports_dir=DEFAULT_REPORTS_DIR, top=TOP_FUNCTIONS):
+    """ solves one job under the profilers, writes its reports and returns the answer """
+    module = load_solution(job.day)
+    part_function = getattr(module, f'part_{job.part}')
+    args = part_arguments(job.day, module, read_input(job.input_path), job.use_cache)
+
+    profiler = cProfile.Profile()
+    sampler = StackSampler() if StackSampler.available() else None
+    profiler.enable()
+    try:
+        if sampler is not None:
+            answer = sampler.runcall(part_function, *args)
+        else:
+            answer = part_function(*args)
+    finally:
+        profiler.disable()
+
+    reports_dir = Path(reports_dir)
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    report_name = f'{job.day.key}-part{job.part}'
+    profiler.dump_stats(reports_dir / f'{report_name}.pstats')
+    (reports_dir / f'{report_name}.txt').write_text(self_time_table(profiler, top))
+    if sampler is not None:
+        (reports_dir / f'{report_name}.folded').write_text(sampler.collapsed())
+    return answer
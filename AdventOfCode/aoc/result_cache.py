@@ -0,0 +1,133 @@
+"""Remembers the answers, so an unchanged part on an unchanged input isn't re-solved.
+
+An answer is stored in .cache/results/<key>.json, where the key is a hash
+of the part number, the input bytes and the solution's source. The source
+hash is taken over the AST of solution.py and of every local module it
+imports (2024 Day 16's solver.py and node.py, or the shared aoc.grid), so
+editing comments or formatting keeps the cached answers, while a real
+code change anywhere the solution depends on misses.
+
+Every entry is written to a temp file and renamed into place, so the
+runner's worker processes can read and write the cache at the same time
+and never see a partial entry. A hit touches the entry's mtime, and once
+the cache grows past MAX_CACHE_BYTES the least recently used entries are
+deleted first.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from aoc.days import AOC_ROOT
+from aoc.parse_cache import write_atomically
+
+RESULT_CACHE_DIR = AOC_ROOT / '.cache' / 'results'
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def imported_names(tree) -> set:
+    """ the dotted names of everything a module imports """
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            # "from aoc import grid" imports the aoc.grid module
+            names.update(f'{node.module}.{alias.name}' for alias in node.names)
+    return names
+
+
+def local_module(name, roots):
+    """ the .py file for an imported name, if it lives in one of the roots """
+    parts = name.split('.')
+    for root in roots:
+        for path in (root.joinpath(*parts).with_suffix('.py'), root.joinpath(*parts, '__init__.py')):
+            if path.is_file():
+                return path
+    return None
+
+
+def source_hash(day) -> str:
+    """ hash of the solution's AST and the ASTs of the local modules it imports """
+    roots = (day.folder, AOC_ROOT)
+    digest = hashlib.sha256()
+    seen = set()
+    pending = [day.solution]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        source = path.read_bytes()
+        try:
+            tree = ast.parse(source, filename=str(path))
+        except SyntaxError:
+            # it won't run as it is, but still hash what's there
+            digest.update(source)
+            continue
+        digest.update(ast.dump(tree).encode())
+        for name in sorted(imported_names(tree)):
+            module_path = local_module(name, roots)
+            if module_path is not None:
+                pending.append(module_path)
+    return digest.hexdigest()
+
+
+def cache_key(job) -> str:
+    digest = hashlib.sha256(source_hash(job.day).encode())
+    digest.update(f'part {job.part}'.encode())
+    digest.update(Path(job.input_path).read_bytes())
+    return f'{job.day.key}-{job.part}-{digest.hexdigest()[:24]}'
+
+
+def lookup(key):
+    """ the cached entry (a dict) for the key, or None """
+    path = RESULT_CACHE_DIR / f'{key}.json'
+    try:
+        entry = json.loads(path.read_text())
+        # mark it as recently used
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.debug(f'ignoring unreadable result cache entry {key}, {e}')
+        return None
+    return entry
+
+
+def store(key, answer, elapsed) -> None:
+    """ caches an answer, then trims the cache back under its size limit """
+    try:
+        data = json.dumps({'answer': answer, 'elapsed': elapsed})
+    except TypeError:
+        logging.debug(f'{key}: a {type(answer).__name__} answer is not cached')
+        return
+    try:
+        write_atomically(RESULT_CACHE_DIR / f'{key}.json', data.encode())
+        evict()
+    except OSError as e:
+        logging.warning(f'could not write the result cache, {e}')
+
+
+def evict(max_bytes=MAX_CACHE_BYTES, cache_dir=RESULT_CACHE_DIR, pattern='*.json') -> None:
+    """ deletes least recently used entries until the cache fits in max_bytes (the parse cache uses it too) """
+    entries = []
+    total_size = 0
+    for path in cache_dir.glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # another worker evicted it first
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total_size += stat.st_size
+    entries.sort()
+    for mtime, size, path in entries:
+        if total_size <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total_size -= size
@@ -0,0 +1,202 @@
+"""Runs any number of days at once, one (day, part) job per worker process.
+
+    python -m aoc run                 # every day of every year
+    python -m aoc run 2024 -d 6 9     # just 2024 Days 6 and 9
+    python -m aoc run 2025 --test     # use input_test.txt instead
+
+Answers are cached (see aoc.result_cache), so only the parts whose
+solution or input changed since the last run are actually solved.
+With --profile every part is solved under the profilers instead, see
+aoc.profiling for the reports that get written. With --metrics the
+solutions' counters and timers (aoc.metrics) are collected for each part
+and summarised after the answers.
+"""
+
+import io
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from aoc import metrics, pools, profiling, result_cache
+from aoc.days import PARTS, Day, find_days, solve
+
+
+@dataclass(frozen=True)
+class Job:
+    """ one part of one day against one input file """
+    day: Day
+    part: int
+    input_path: Path
+    use_cache: bool = True
+    # where to write profiling reports, None when not profiling
+    profile_dir: Path = None
+    profile_top: int = profiling.TOP_FUNCTIONS
+    # the size of a generated input (see aoc.generators), None for the puzzle's own
+    size: int = None
+    collect_metrics: bool = False
+
+
+@dataclass
+class JobResult:
+    """ what came back from running a Job """
+    job: Job
+    answer: object = None
+    elapsed: float = 0.0
+    error: str = ''
+    output: str = ''
+    cached: bool = False
+    metrics: dict = None
+
+
+def run_job(job, quiet=True) -> JobResult:
+    """ runs a single job, catching anything the solution raises """
+    result = JobResult(job)
+    # a profiled or measured job has to actually run
+    use_result_cache = job.use_cache and job.profile_dir is None and not job.collect_metrics
+    if use_result_cache:
+        key = result_cache.cache_key(job)
+        entry = result_cache.lookup(key)
+        if entry is not None:
+            result.answer = entry['answer']
+            result.elapsed = entry['elapsed']
+            result.cached = True
+            return result
+    # the solutions print progress as they go, which is just noise
+    # when many days run side by side, so it's captured instead
+    captured = io.StringIO()
+    metrics.reset()
+    metrics.enable(job.collect_metrics)
+    start_time = time.perf_counter()
+    if job.profile_dir is not None:
+        solve_job = lambda: profiling.profile_part(job, job.profile_dir, job.profile_top)
+    else:
+        solve_job = lambda: solve(job.day, job.part, job.input_path, job.use_cache)
+    try:
+        if quiet:
+            with redirect_stdout(captured):
+                result.answer = solve_job()
+        else:
+            result.answer = solve_job()
+    except Exception as e:
+        result.error = f'{type(e).__name__}: {e}'
+    result.elapsed = time.perf_counter() - start_time
+    result.output = captured.getvalue()
+    if job.collect_metrics:
+        result.metrics = metrics.snapshot()
+        metrics.enable(False)
+    if use_result_cache and not result.error and result.answer is not None:
+        result_cache.store(key, result.answer, result.elapsed)
+    return result
+
+
+def make_jobs(days, parts=PARTS, use_test=False, use_cache=True) -> list:
+    """ one job for each part of each day that actually has an input file """
+    jobs = []
+    for day in days:
+        input_path = day.input_file(use_test)
+        if not input_path.is_file() or input_path.stat().st_size == 0:
+            logging.info(f'{day}: no input in {input_path.name}, skipping')
+            continue
+        for part in parts:
+            jobs.append(Job(day, part, input_path, use_cache))
+    return jobs
+
+
+def run_jobs(jobs, workers=None, quiet=True) -> list:
+    """ runs the jobs across a process pool (or inline when workers == 1) """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+    results = []
+    if workers == 1:
+        for job in jobs:
+            results.append(run_job(job, quiet))
+    else:
+        # a day that starts its own pool only gets this worker's share of the CPUs
+        with ProcessPoolExecutor(max_workers=workers, initializer=pools.share_cpus, initargs=(workers,)) as pool:
+            futures = [pool.submit(run_job, job, quiet) for job in jobs]
+            for future in as_completed(futures):
+                result = future.result()
+                logging.debug(f'{result.job.day} part {result.job.part} done in {result.elapsed:.3f} secs')
+                results.append(result)
+    results.sort(key=lambda r: (r.job.day.year, r.job.day.number, r.job.part))
+    return results
+
+
+def print_results(results, wall_time) -> None:
+    """ pretty prints a table of the answers and how long each one took """
+    print(f'{"day":>12} {"part":>4} {"secs":>9}  answer')
+    cpu_time = 0.0
+    for r in results:
+        if r.cached:
+            print(f'{str(r.job.day):>12} {r.job.part:>4} {"cached":>9}  {r.answer}')
+            continue
+        cpu_time += r.elapsed
+        answer = f'ERROR {r.error}' if r.error else r.answer
+        print(f'{str(r.job.day):>12} {r.job.part:>4} {r.elapsed:9.3f}  {answer}')
+    print(f'{len(results)} jobs, {cpu_time:.3f} secs of solving in {wall_time:.3f} secs wall time')
+
+
+def print_metrics(results) -> None:
+    """ the metrics each part collected, under the results table """
+    for r in results:
+        if r.metrics is None:
+            continue
+        lines = metrics.summary(r.metrics) or ['(none collected)']
+        print(f'\n{r.job.day} part {r.job.part}:')
+        for line in lines:
+            print(f'  {line}')
+
+
+def save_metrics(results, metrics_file) -> None:
+    """ writes every part's metrics to a JSON file, keyed by "year/day/part" """
+    collected = {f'{r.job.day.year}/{r.job.day.number:02d}/{r.job.part}': r.metrics
+                 for r in results if r.metrics is not None}
+    Path(metrics_file).write_text(json.dumps(collected, indent=2, sort_keys=True), encoding='utf-8')
+
+
+def add_parser(subparsers):
+    parser = subparsers.add_parser('run', help='run the solutions in parallel')
+    add_selection_arguments(parser)
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of worker processes (default: one per core)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="let the solutions' own printing through")
+    parser.add_argument('--no-cache', action='store_true', help='ignore the parse and answer caches, and solve everything')
+    parser.add_argument('--profile', nargs='?', const=profiling.DEFAULT_REPORTS_DIR, metavar='DIR',
+                        help=f'profile each part and write reports to DIR (default: {profiling.DEFAULT_REPORTS_DIR})')
+    parser.add_argument('--profile-top', type=int, default=profiling.TOP_FUNCTIONS,
+                        help='functions listed in the self time table')
+    parser.add_argument('--metrics', nargs='?', const='', metavar='FILE',
+                        help="collect the solutions' counters and timers, and save them to FILE as JSON")
+    parser.set_defaults(func=main)
+
+
+def add_selection_arguments(parser):
+    """ the year/day/part/input options shared by the subcommands """
+    parser.add_argument('years', nargs='*', type=int, help='years to run (default: all)')
+    parser.add_argument('-d', '--days', nargs='+', type=int, help='day numbers to run')
+    parser.add_argument('-p', '--parts', nargs='+', type=int, choices=PARTS, default=list(PARTS))
+    parser.add_argument('-t', '--test', action='store_true', help='use input_test.txt')
+
+
+def main(args) -> int:
+    days = find_days(args.years, args.days)
+    jobs = make_jobs(days, args.parts, args.test, use_cache=not args.no_cache)
+    if args.profile:
+        jobs = [replace(job, profile_dir=Path(args.profile), profile_top=args.profile_top) for job in jobs]
+    if args.metrics is not None:
+        jobs = [replace(job, collect_metrics=True) for job in jobs]
+    start_time = time.perf_counter()
+    results = run_jobs(jobs, workers=args.jobs, quiet=not args.verbose)
+    print_results(results, time.perf_counter() - start_time)
+    if args.metrics is not None:
+        print_metrics(results)
+        if args.metrics:
+            save_metrics(results, args.metrics)
+    return 1 if any(r.error for r in results) else 0
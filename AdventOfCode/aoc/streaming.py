@@ -0,0 +1,127 @@
+"""Streams a line-oriented input through a day in a single pass.
+
+A day that only ever needs one line at a time can define
+
+    def stream(lines) -> tuple:
+        ...
+        return answer_1, answer_2
+
+which works through the lines once and keeps only running totals, so
+both parts come out of one pass over the input in constant memory. The
+input is read in fixed-size chunks and split into lines as it goes, so
+it can be bigger than RAM or piped in on stdin:
+
+    python -m aoc stream 2024 -d 1 2 3 7
+    cat huge_reports.txt | python -m aoc stream 2024 -d 2 --input -
+
+The lines handed to stream() have their line ending removed and are
+otherwise untouched. A day whose input is one long separated line (2025
+Day 2 is comma separated) sets STREAM_SEPARATOR so its records are split
+out as they're read instead of after the whole line is in memory. A day
+with no useful lines at all (2024 Day 3 is one memory dump) sets
+STREAM_CHUNKS = True and its stream() gets the raw byte chunks instead.
+"""
+
+import logging
+import sys
+import time
+from pathlib import Path
+
+from aoc.days import find_days, load_solution
+from aoc.runner import add_selection_arguments
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_chunks(source, chunk_size=CHUNK_SIZE):
+    """ yields the raw bytes of a file (or stdin for '-') a chunk at a time """
+    if str(source) == '-':
+        f = sys.stdin.buffer
+        while chunk := f.read(chunk_size):
+            yield chunk
+        return
+    with Path(source).open('rb') as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def split_records(chunks, separator=None):
+    """ splits the chunks into records at each newline (and separator), even across chunk boundaries """
+    pending = b''
+    for chunk in chunks:
+        if separator:
+            chunk = chunk.replace(separator, b'\n')
+        records = (pending + chunk).split(b'\n')
+        # the last piece may carry on in the next chunk
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+
+def decode_records(records):
+    for record in records:
+        yield record.rstrip(b'\r').decode()
+
+
+def stream_lines(source, separator=None, chunk_size=CHUNK_SIZE):
+    """ the full pipeline: chunks -> records -> str lines """
+    if isinstance(separator, str):
+        separator = separator.encode()
+    return decode_records(split_records(read_chunks(source, chunk_size), separator))
+
+
+def stream_day(day, source, chunk_size=CHUNK_SIZE) -> tuple:
+    """ runs a day's stream() over the source and returns both answers """
+    module = load_solution(day)
+    if getattr(module, 'STREAM_CHUNKS', False):
+        return module.stream(read_chunks(source, chunk_size))
+    separator = getattr(module, 'STREAM_SEPARATOR', None)
+    return module.stream(stream_lines(source, separator, chunk_size))
+
+
+def add_parser(subparsers):
+    parser = subparsers.add_parser('stream', help='solve both parts in one streaming pass')
+    add_selection_arguments(parser)
+    parser.add_argument('-i', '--input', help="file to stream instead of the day's input ('-' for stdin)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='bytes read at a time')
+    parser.set_defaults(func=main)
+
+
+def load_streaming_day(day):
+    """ the day's solution if it has a stream(), None if it doesn't; raises if it won't load """
+    module = load_solution(day)
+    return module if hasattr(module, 'stream') else None
+
+
+def main(args) -> int:
+    days = find_days(args.years, args.days)
+    streaming_days = []
+    failed = False
+    for day in days:
+        # like the runner, a day that won't load is reported and the rest still run
+        try:
+            module = load_streaming_day(day)
+        except Exception as e:
+            print(f'{day}: ERROR {type(e).__name__}: {e}')
+            failed = True
+            continue
+        if module is None:
+            logging.info(f'{day}: has no stream(), skipping')
+        else:
+            streaming_days.append(day)
+    if args.input == '-' and len(streaming_days) > 1:
+        logging.error('stdin can only be streamed into a single day')
+        return 1
+    for day in streaming_days:
+        source = args.input or day.input_file(args.test)
+        start_time = time.perf_counter()
+        try:
+            answer_1, answer_2 = stream_day(day, source, args.chunk_size)
+        except Exception as e:
+            print(f'{day}: ERROR {type(e).__name__}: {e}')
+            failed = True
+            continue
+        elapsed = time.perf_counter() - start_time
+        print(f'{day}: part 1 answer: {answer_1}, part 2 answer: {answer_2} ({elapsed:.3f} secs)')
+    return 1 if failed else 0
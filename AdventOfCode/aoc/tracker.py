@@ -0,0 +1,162 @@
+"""Tracks benchmark results across commits and flags slowdowns.
+
+Every run is stored in a local SQLite file along with the commit it ran
+against. Each (year, day, part, input hash) has a baseline run, and new
+runs fail when their median time is more than --threshold percent slower
+than it. The answers are checked against the ones noted in solution.py
+in the same pass, so a wrong answer fails no matter how fast it is, and
+a wrong answer is never taken as the new baseline.
+
+    python -m aoc track 2024 -d 9              # compare against the baseline
+    python -m aoc track 2024 -d 9 --update     # accept these results as the baseline
+"""
+
+import logging
+import sqlite3
+import subprocess
+from itertools import groupby
+
+from aoc.answers import expected_answers
+from aoc.bench import PARSE, part_label, run_benchmarks, with_parse_jobs
+from aoc.days import AOC_ROOT, find_days
+from aoc.runner import add_selection_arguments, make_jobs
+
+DEFAULT_DATABASE = 'bench_history.sqlite'
+DEFAULT_THRESHOLD = 10.0
+# timings this close together are just noise, whatever the percentage
+MIN_SLOWDOWN_SECS = 0.001
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    commit_id TEXT, timestamp TEXT,
+    year INTEGER, day INTEGER, part INTEGER, input_hash TEXT,
+    min REAL, median REAL, p95 REAL, peak_rss_kb INTEGER,
+    answer TEXT, correct INTEGER, error TEXT
+);
+CREATE TABLE IF NOT EXISTS baselines (
+    year INTEGER, day INTEGER, part INTEGER, input_hash TEXT,
+    run_id INTEGER REFERENCES runs(id),
+    PRIMARY KEY (year, day, part, input_hash)
+);
+'''
+
+
+def current_commit() -> str:
+    """ short hash of HEAD, with a '+' when the tree has uncommitted changes """
+    try:
+        commit_id = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=AOC_ROOT,
+                                   capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=AOC_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return commit_id + ('+' if dirty else '')
+
+
+def open_database(database_file):
+    connection = sqlite3.connect(database_file)
+    connection.row_factory = sqlite3.Row
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def check_answer(record, expected, use_test):
+    """ True/False against the noted answer, or None when there's nothing to check against """
+    if 'error' in record:
+        return False
+    expected_answer = expected.get('test' if use_test else 'data')
+    if expected_answer is None:
+        return None
+    return record['answer'] == expected_answer
+
+
+def store_run(connection, record, commit_id, correct) -> int:
+    cursor = connection.execute(
+        'INSERT INTO runs (commit_id, timestamp, year, day, part, input_hash, min, median, p95, '
+        'peak_rss_kb, answer, correct, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        (commit_id, record['timestamp'], record['year'], record['day'], record['part'],
+         record['input_hash'], record.get('min'), record.get('median'), record.get('p95'),
+         record.get('peak_rss_kb'), record.get('answer'), correct, record.get('error')))
+    return cursor.lastrowid
+
+
+def find_baseline(connection, record):
+    return connection.execute(
+        'SELECT runs.* FROM baselines JOIN runs ON runs.id = baselines.run_id '
+        'WHERE baselines.year = ? AND baselines.day = ? AND baselines.part = ? AND baselines.input_hash = ?',
+        (record['year'], record['day'], record['part'], record['input_hash'])).fetchone()
+
+
+def set_baseline(connection, record, run_id) -> None:
+    connection.execute(
+        'INSERT OR REPLACE INTO baselines (year, day, part, input_hash, run_id) VALUES (?, ?, ?, ?, ?)',
+        (record['year'], record['day'], record['part'], record['input_hash'], run_id))
+
+
+def compare(record, baseline, correct, threshold) -> tuple:
+    """ returns (failed, status text) for one record against its baseline """
+    if 'error' in record:
+        return True, f'ERROR {record["error"]}'
+    if correct is False:
+        return True, f'WRONG answer {record["answer"]}'
+    if baseline is None:
+        return False, 'new baseline'
+    change = 100.0 * (record['median'] / baseline['median'] - 1.0)
+    status = f'{change:+.1f}% vs {baseline["commit_id"]}'
+    if change > threshold and record['median'] - baseline['median'] > MIN_SLOWDOWN_SECS:
+        return True, 'SLOWER ' + status
+    return False, status
+
+
+def track(jobs, database_file, threshold, use_test, update_baseline, repeats, warmup) -> bool:
+    """ benchmarks the jobs, records them and prints a per-day report; returns True if all passed """
+    records = run_benchmarks(with_parse_jobs(jobs), repeats, warmup)
+    days = {(job.day.year, job.day.number): job.day for job in jobs}
+    commit_id = current_commit()
+    all_passed = True
+    connection = open_database(database_file)
+    with connection:
+        report = []
+        for record in records.values():
+            day = days[(record['year'], record['day'])]
+            if record['part'] == PARSE:
+                # parse() has no answer to check, just its time
+                correct = False if 'error' in record else None
+            else:
+                correct = check_answer(record, expected_answers(day)[record['part']], use_test)
+            baseline = find_baseline(connection, record)
+            failed, status = compare(record, baseline, correct, threshold)
+            run_id = store_run(connection, record, commit_id, correct)
+            if correct is not False and 'error' not in record and (baseline is None or update_baseline):
+                set_baseline(connection, record, run_id)
+            all_passed = all_passed and not failed
+            report.append((day, record, correct, failed, status))
+    connection.close()
+
+    for day, day_report in groupby(report, key=lambda r: r[0]):
+        print(f'{day}:')
+        for _, record, correct, failed, status in day_report:
+            median = f'{record["median"]:.4f}s' if 'median' in record else '-'
+            checked = {True: 'answer ok', False: 'answer WRONG', None: 'answer unchecked'}[correct]
+            print(f'  {part_label(record["part"]) + ":":8} {"FAIL" if failed else "ok  "} {median:>10}  {checked:16}  {status}')
+    logging.info(f'{len(records)} results recorded for {commit_id} in {database_file}')
+    return all_passed
+
+
+def add_parser(subparsers):
+    parser = subparsers.add_parser('track', help='compare benchmarks against the stored baseline')
+    add_selection_arguments(parser)
+    parser.add_argument('-n', '--repeats', type=int, default=5, help='timed runs per part')
+    parser.add_argument('-w', '--warmup', type=int, default=1, help='untimed runs before timing')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='percent slower than the baseline that counts as a regression')
+    parser.add_argument('--update', action='store_true', help='make these results the new baseline')
+    parser.add_argument('--database', default=DEFAULT_DATABASE, help='SQLite history file')
+    parser.set_defaults(func=main)
+
+
+def main(args) -> int:
+    jobs = make_jobs(find_days(args.years, args.days), args.parts, args.test)
+    passed = track(jobs, args.database, args.threshold, args.test, args.update, args.repeats, args.warmup)
+    return 0 if passed else 1
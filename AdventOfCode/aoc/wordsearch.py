@@ -0,0 +1,130 @@
+"""Finds words and small cell patterns in a Grid, in every direction at once.
+
+    search = WordSearch(grid, reach=3)
+    found = search.match(word_pattern('XMAS', (1, 1)))   # every SE XMAS
+    search.count(found), search.hits(found)
+
+    count_words(grid, ['XMAS'])        # {'XMAS': 18}, all 8 directions
+    find_words(grid, ['XMAS', 'MAS'])  # {'XMAS': [(row, col, (dr, dc)), ...], ...}
+
+A pattern is a list of ((dr, dc), value) pairs, and a cell matches it when
+the cell that far away holds the value, for every pair. The grid is laid
+out flat with `reach` filler cells after each row, so stepping up to
+reach columns off either side of a row lands on filler rather than
+wrapping onto the next row.
+
+Rather than walking out from every cell, each pattern pair is one whole-grid
+mask of the cells holding that value, shifted by the pair's flat offset, and
+a pattern is those masks ANDed together. The masks are big Python ints (one
+byte per cell, so a mask is the grid's bytes translated to 0/1), and numpy
+bool arrays for grids of NUMPY_MIN_BYTES or more when numpy is installed.
+"""
+
+from aoc.grid import DIRS8
+from aoc.lazy import optional_import
+from aoc.loader import NUMPY_MIN_BYTES
+
+np = optional_import('numpy')
+
+FILLER = 0
+
+
+def word_pattern(word, direction) -> list:
+    """ the pattern for a word read from its first letter in the (dr, dc) direction """
+    dr, dc = direction
+    return [((k * dr, k * dc), value) for k, value in enumerate(word.encode())]
+
+
+class WordSearch:
+    """ a grid laid out flat with filler after each row, for matching patterns against """
+
+    def __init__(self, grid, reach):
+        self.width = grid.width
+        self.height = grid.height
+        self.stride = grid.width + reach
+        filler = bytes([FILLER]) * reach
+        self.cells = b''.join(row + filler for row in grid.rows())
+        self._size = len(self.cells)
+        self._numpy = np is not None and self._size >= NUMPY_MIN_BYTES
+        self._masks = {}
+        self._real = self._mask_where(lambda value: value != FILLER)
+
+    def _mask_where(self, is_set):
+        if self._numpy:
+            table = np.array([is_set(value) for value in range(256)], dtype=bool)
+            return table[np.frombuffer(self.cells, dtype=np.uint8)]
+        table = bytes(1 if is_set(value) else 0 for value in range(256))
+        return int.from_bytes(self.cells.translate(table), 'little')
+
+    def mask(self, value):
+        """ the cells holding the value """
+        if value not in self._masks:
+            self._masks[value] = self._mask_where(lambda v: v == value)
+        return self._masks[value]
+
+    def shifted(self, value, dr, dc):
+        """ the cells whose (dr, dc) neighbor holds the value """
+        offset = dr * self.stride + dc
+        found = self.mask(value)
+        if self._numpy:
+            moved = np.zeros(self._size, dtype=bool)
+            if abs(offset) < self._size:
+                if offset >= 0:
+                    moved[:self._size - offset] = found[offset:]
+                else:
+                    moved[-offset:] = found[:self._size + offset]
+            return moved
+        if offset >= 0:
+            return found >> (8 * offset)
+        return found << (-8 * offset)
+
+    def match(self, pattern):
+        """ the cells matching every ((dr, dc), value) pair of the pattern """
+        found = self._real
+        for (dr, dc), value in pattern:
+            found = found & self.shifted(value, dr, dc)
+        return found
+
+    def match_any(self, patterns):
+        """ the cells matching at least one of the patterns """
+        found = None
+        for pattern in patterns:
+            matched = self.match(pattern)
+            found = matched if found is None else found | matched
+        return found
+
+    def count(self, found) -> int:
+        if self._numpy:
+            return int(np.count_nonzero(found))
+        # every matching cell is a single 1 bit
+        return found.bit_count()
+
+    def hits(self, found) -> list:
+        """ (row, col) of each matching cell, in reading order """
+        if self._numpy:
+            indexes = np.flatnonzero(found).tolist()
+        else:
+            flags = found.to_bytes(self._size, 'little')
+            indexes = []
+            i = flags.find(1)
+            while i >= 0:
+                indexes.append(i)
+                i = flags.find(1, i + 1)
+        return [divmod(i, self.stride) for i in indexes]
+
+
+def find_words(grid, words, directions=DIRS8) -> dict:
+    """ (row, col, direction) of the first letter of every time each word appears """
+    search = WordSearch(grid, reach=max(len(word) for word in words) - 1)
+    found = {}
+    for word in words:
+        found[word] = [(r, c, direction) for direction in directions
+                       for r, c in search.hits(search.match(word_pattern(word, direction)))]
+    return found
+
+
+def count_words(grid, words, directions=DIRS8) -> dict:
+    """ how many times each word appears """
+    search = WordSearch(grid, reach=max(len(word) for word in words) - 1)
+    return {word: sum(search.count(search.match(word_pattern(word, direction))) for direction in directions)
+            for word in words}